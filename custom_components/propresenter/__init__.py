@@ -51,7 +51,16 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     streaming_coordinator = ProPresenterStreamingCoordinator(
         hass, coordinator.api, coordinator
     )
-    await streaming_coordinator.async_config_entry_first_refresh()
+
+    # Start streaming before the first refresh so the stream's initial snapshot
+    # populates the data instead of a full round of REST requests
+    # (uses asyncio.create_task so HA doesn't wait for it)
+    await streaming_coordinator.start_streaming()
+    try:
+        await streaming_coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        await streaming_coordinator.async_shutdown()
+        raise
 
     # Store all coordinators in config entry runtime data
     config_entry.runtime_data = {
@@ -70,12 +79,17 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
-    # Start streaming in background (uses asyncio.create_task so HA doesn't wait for it)
-    await streaming_coordinator.start_streaming()
+    # Reload when options change so entities pick them up
+    config_entry.async_on_unload(config_entry.add_update_listener(async_reload_entry))
 
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Reload a config entry after its options changed."""
+    await hass.config_entries.async_reload(config_entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
 
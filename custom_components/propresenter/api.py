@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Sequence
 from typing import Any
 
 import aiohttp
 import async_timeout
+import orjson
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,7 +59,12 @@ class ProPresenterAPI:
         if self._session and not self._session.closed:
             await self._session.close()
 
-    async def stream_status_updates(self, endpoints: list[str], callback):
+    async def stream_status_updates(
+        self,
+        endpoints: Sequence[str],
+        callback,
+        on_connected: Callable[[], None] | None = None,
+    ):
         """Stream status updates from ProPresenter.
 
         This creates a persistent connection to /v1/status/updates and calls
@@ -66,6 +73,7 @@ class ProPresenterAPI:
         Args:
             endpoints: List of endpoints to monitor (e.g., ['transport/audio/current', 'transport/audio/time'])
             callback: Async function to call with update data (path, data)
+            on_connected: Optional function called once the stream is established
         """
         url = f"{self.base_url}/v1/status/updates"
         session = await self._get_session()
@@ -88,23 +96,22 @@ class ProPresenterAPI:
             ) as response:
                 response.raise_for_status()
                 _LOGGER.info("Stream connection established, reading updates...")
+                if on_connected is not None:
+                    on_connected()
 
                 # Read the chunked response line by line
                 async for line in response.content:
                     if line:
                         try:
                             # Each line is a JSON object with the update
-                            import json
-
-                            decoded_line = line.decode("utf-8").strip()
-                            if decoded_line:
+                            if line.strip():
                                 # No logging here - runs every second for timer updates
-                                data = json.loads(decoded_line)
+                                data = orjson.loads(line)
                                 # Data format: {"url": "path", "data": {...}}
                                 path = data.get("url")
                                 update_data = data.get("data")
                                 await callback(path, update_data)
-                        except json.JSONDecodeError as err:
+                        except orjson.JSONDecodeError as err:
                             # Log at debug level - these are typically benign stream formatting lines
                             _LOGGER.debug(
                                 f"Could not decode line: {line[:100]} - Error: {err}"
@@ -157,7 +164,8 @@ class ProPresenterAPI:
 
                     content_type = response.headers.get("content-type", "")
                     if "application/json" in content_type:
-                        return await response.json()
+                        body = await response.read()
+                        return orjson.loads(body) if body.strip() else None
                     return None
 
         except aiohttp.ClientConnectorError as err:
@@ -905,25 +913,65 @@ class ProPresenterAPI:
         Returns:
             The thumbnail image data as bytes, or None if error
         """
+        thumbnail_data, _, _ = await self.get_presentation_thumbnail_conditional(
+            presentation_uuid, slide_index, quality=quality
+        )
+        return thumbnail_data or None
+
+    async def get_presentation_thumbnail_conditional(
+        self,
+        presentation_uuid: str,
+        slide_index: int,
+        quality: int = 400,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> tuple[bytes | None, str | None, str | None]:
+        """Get a slide thumbnail unless it is unchanged since a cached copy.
+
+        Args:
+            presentation_uuid: The UUID of the presentation
+            slide_index: The index of the slide (0-based)
+            quality: Image quality (200-800, default 400)
+            etag: ETag of the cached copy, sent as If-None-Match
+            last_modified: Last-Modified of the cached copy, sent as If-Modified-Since
+
+        Returns:
+            Tuple of (image data, ETag, Last-Modified). The image data is
+            empty bytes if the thumbnail is unchanged, or None if error
+        """
         url = f"/v1/presentation/{presentation_uuid}/thumbnail/{slide_index}?quality={quality}"
         session = await self._get_session()
 
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
         try:
             async with async_timeout.timeout(10):
-                async with session.get(f"{self.base_url}{url}") as response:
+                async with session.get(
+                    f"{self.base_url}{url}", headers=headers
+                ) as response:
                     if response.status == 200:
-                        return await response.read()
+                        return (
+                            await response.read(),
+                            response.headers.get("ETag"),
+                            response.headers.get("Last-Modified"),
+                        )
+                    elif response.status == 304:
+                        return b"", etag, last_modified
                     elif response.status == 404:
                         _LOGGER.debug("Thumbnail not found: %s", url)
-                        return None
+                        return None, None, None
                     else:
                         _LOGGER.warning(
                             "Error fetching thumbnail: %s - %s", response.status, url
                         )
-                        return None
+                        return None, None, None
         except Exception as e:
             _LOGGER.error("Error fetching thumbnail %s: %s", url, e)
-            return None
+            return None, None, None
 
     async def get_looks(self) -> list[dict[str, Any]]:
         """Get list of all configured looks.
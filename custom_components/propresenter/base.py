@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -93,3 +95,36 @@ class ProPresenterBaseEntity(CoordinatorEntity):
             static_coordinator if static_coordinator else coordinator
         )
         self._attr_device_info = get_device_info(device_info_coordinator, config_entry)
+
+
+class ConditionalStateWriteMixin(ABC):
+    """Mixin for entities that only write state when it actually changed.
+
+    Subclasses return the values of their user-visible properties (including
+    availability) from _state_snapshot(). _write_state_if_changed() skips the
+    write when the snapshot matches the last one written.
+    """
+
+    _last_written_snapshot: tuple | None = None
+
+    @abstractmethod
+    def _state_snapshot(self) -> tuple:
+        """Return the values that make up this entity's visible state."""
+
+    def _write_state_if_changed(self, snapshot: tuple | None = None) -> bool:
+        """Write state if the snapshot changed since the last write.
+
+        Returns True if state was written.
+        """
+        # Only write state if entity is added to hass
+        if self.hass is None:
+            return False
+
+        if snapshot is None:
+            snapshot = self._state_snapshot()
+        if snapshot == self._last_written_snapshot:
+            return False
+
+        self._last_written_snapshot = snapshot
+        self.async_write_ha_state()
+        return True
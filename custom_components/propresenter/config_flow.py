@@ -7,14 +7,25 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
 from .api import ProPresenterAPI, ProPresenterConnectionError
-from .const import CONF_PORT, DEFAULT_PORT, DOMAIN
+from .const import (
+    CONF_PORT,
+    CONF_THUMBNAIL_QUALITY,
+    DEFAULT_PORT,
+    DEFAULT_THUMBNAIL_QUALITY,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -102,6 +113,12 @@ class ProPresenterConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return ProPresenterOptionsFlow()
+
     async def async_step_reconfigure(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -320,5 +337,30 @@ class ProPresenterConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
 
+class ProPresenterOptionsFlow(OptionsFlow):
+    """Handle ProPresenter options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_THUMBNAIL_QUALITY,
+                        default=self.config_entry.options.get(
+                            CONF_THUMBNAIL_QUALITY, DEFAULT_THUMBNAIL_QUALITY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=200, max=800)),
+                }
+            ),
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
@@ -5,7 +5,18 @@ DOMAIN = "propresenter"
 # Configuration constants
 CONF_PORT = "port"
 DEFAULT_PORT = 50001
+CONF_THUMBNAIL_QUALITY = "thumbnail_quality"
+DEFAULT_THUMBNAIL_QUALITY = 500  # Slide thumbnail quality, 200-800 (higher = better)
 DEFAULT_SCAN_INTERVAL = 5  # Poll every 5 seconds for faster updates
+STATIC_SCAN_INTERVAL = 30  # Base poll interval for static data (version, macros...)
+MAX_STATIC_SCAN_INTERVAL = 300  # Back off to at most 5 minutes while nothing changes
+STATIC_SCAN_BACKOFF = 1.5  # Interval multiplier applied after an unchanged poll
+ACTIVE_PLAYLIST_POLL_INTERVAL = 2  # Active media playlist poll rate after a change
+MAX_ACTIVE_PLAYLIST_POLL_INTERVAL = 30  # Slowest active media playlist poll rate
+ACTIVE_PLAYLIST_POLL_BACKOFF = 1.25  # Multiplier applied after an unchanged poll
+DETAIL_FETCH_TIMEOUT = 5  # Seconds before a single playlist detail fetch is dropped
+DETAIL_FETCH_CONCURRENCY = 4  # Playlist detail requests allowed in flight at once
+INITIAL_SNAPSHOT_TIMEOUT = 3  # Seconds to wait for the stream's initial snapshot
 
 # API endpoints
 API_VERSION = "v1"
@@ -1,24 +1,230 @@
 """DataUpdateCoordinator for ProPresenter integration."""
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
+import hashlib
 import logging
-from typing import Any
+import random
+from typing import Any, TypedDict
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import async_get as async_get_device_registry
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+import orjson
 
 from .api import ProPresenterAPI, ProPresenterConnectionError
-from .const import CONF_PORT, DEFAULT_PORT, DOMAIN
-from .utils import collect_playlist_uuids
+from .const import (
+    ACTIVE_PLAYLIST_POLL_BACKOFF,
+    ACTIVE_PLAYLIST_POLL_INTERVAL,
+    CONF_PORT,
+    DEFAULT_PORT,
+    DETAIL_FETCH_CONCURRENCY,
+    DETAIL_FETCH_TIMEOUT,
+    DOMAIN,
+    INITIAL_SNAPSHOT_TIMEOUT,
+    MAX_ACTIVE_PLAYLIST_POLL_INTERVAL,
+    MAX_STATIC_SCAN_INTERVAL,
+    STATIC_SCAN_BACKOFF,
+    STATIC_SCAN_INTERVAL,
+)
+from .utils import (
+    PlaylistItemIndex,
+    StageLayoutIndex,
+    build_playlist_item_index,
+    build_stage_layout_index,
+    collect_playlist_uuids,
+    index_by_uuid,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class ProPresenterCoordinator(DataUpdateCoordinator):
+class ProPresenterStreamingData(TypedDict, total=False):
+    """Fixed set of keys held by the streaming coordinator."""
+
+    active_presentation: dict[str, Any]
+    slide_index: dict[str, Any] | None
+    announcement_slide_index: dict[str, Any] | None
+    stage_screens: list[dict[str, Any]]
+    stage_layouts: list[dict[str, Any]]
+    layout_map: list[dict[str, Any]]
+    messages: list[dict[str, Any]]
+    props: list[dict[str, Any]]
+    looks: list[dict[str, Any]]
+    current_look: dict[str, Any]
+    status_layers: dict[str, Any]
+    audience_screens_status: bool
+    stage_screens_status: bool
+    stage_message: str
+    capture_status: dict[str, Any]
+    timers: list[dict[str, Any]]
+    timers_current: list[dict[str, Any]]
+    audio_transport_state: dict[str, Any]
+    audio_transport_time: float
+    presentation_transport_state: dict[str, Any]
+    presentation_transport_time: float
+    active_media_playlist: dict[str, Any]
+    video_input: dict[str, Any]
+
+
+# Stream path -> streaming coordinator data key
+_STREAM_PATH_TO_KEY: dict[str, str] = {
+    "presentation/current": "active_presentation",
+    "presentation/slide_index": "slide_index",
+    "announcement/slide_index": "announcement_slide_index",
+    "stage/screens": "stage_screens",
+    "stage/layouts": "stage_layouts",
+    "stage/layout_map": "layout_map",
+    "messages": "messages",
+    "props": "props",
+    "looks": "looks",
+    "look/current": "current_look",
+    "status/layers": "status_layers",
+    "status/audience_screens": "audience_screens_status",
+    "status/stage_screens": "stage_screens_status",
+    "capture/status": "capture_status",
+    "timers": "timers",
+    "timers/current": "timers_current",
+    "transport/audio/current": "audio_transport_state",
+    "transport/audio/time": "audio_transport_time",
+    "transport/presentation/current": "presentation_transport_state",
+    "transport/presentation/time": "presentation_transport_time",
+    "stage/message": "stage_message",
+}
+
+# Paths subscribed on the status stream; derived from the table so they never drift
+_STREAM_PATHS: tuple[str, ...] = tuple(_STREAM_PATH_TO_KEY)
+
+# Initially fetched data keys that the stream also delivers as a snapshot on connect
+_SNAPSHOT_KEYS = frozenset(
+    {
+        "active_presentation",
+        "stage_screens",
+        "stage_layouts",
+        "layout_map",
+        "messages",
+        "props",
+        "looks",
+        "current_look",
+        "status_layers",
+        "audience_screens_status",
+        "stage_screens_status",
+        "stage_message",
+        "audio_transport_state",
+        "presentation_transport_state",
+    }
+)
+
+# Sentinel for data keys that have not been populated yet
+_MISSING = object()
+
+# Sentinel for playlist details whose fetch timed out
+_DETAILS_TIMED_OUT = object()
+
+# Factories for the empty value of non-list data keys
+_STREAM_DEFAULT: dict[str, type] = {
+    "active_presentation": dict,
+    "current_look": dict,
+    "status_layers": dict,
+    "audience_screens_status": bool,
+    "stage_screens_status": bool,
+    "stage_message": str,
+    "audio_transport_state": dict,
+    "presentation_transport_state": dict,
+    "active_media_playlist": dict,
+}
+
+
+def _props_with_ids(props: Any) -> Any:
+    """Drop props without an id object, so entities can read prop["id"] directly."""
+    if not isinstance(props, list):
+        return props
+    return [prop for prop in props if isinstance(prop.get("id"), dict)]
+
+
+# Normalizers applied to streamed and initially fetched data before it's stored
+_STREAM_NORMALIZERS: dict[str, Callable[[Any], Any]] = {
+    "props": _props_with_ids,
+}
+
+# Stream reconnect backoff bounds (seconds)
+STREAM_RECONNECT_DELAY = 5
+MAX_STREAM_RECONNECT_DELAY = 30
+
+# Window used to coalesce bursty stream events into one listener notification
+STREAM_NOTIFY_DELAY = 0.05
+
+# Stream paths that change entity structure/options and are notified immediately
+_IMMEDIATE_NOTIFY_PATHS = frozenset(
+    {
+        "presentation/current",
+        "messages",
+        "props",
+        "looks",
+    }
+)
+
+# Stream data keys whose change may mean the active media playlist changed
+_ACTIVE_PLAYLIST_NUDGE_KEYS = frozenset(
+    {"active_presentation", "presentation_transport_state"}
+)
+
+
+# build_playlist_item_index options for each indexed playlist details list
+_ITEM_INDEX_OPTIONS: dict[str, dict[str, Any]] = {
+    "audio_playlist_details_list": {
+        "item_type": "audio",
+        "default_name": "Unknown Track",
+        "strip_suffix": ".mp3",
+    },
+    "media_playlist_details_list": {},
+}
+
+
+# Data keys the stage layout index is built from, in build_stage_layout_index order
+_STAGE_LAYOUT_INDEX_KEYS = ("stage_screens", "stage_layouts", "layout_map")
+
+
+def _playlist_uuid(playlist: dict[str, Any]) -> str | None:
+    """Return a playlist's UUID, or None if the payload has no id."""
+    try:
+        return playlist["id"]["uuid"]
+    except (KeyError, TypeError):
+        return None
+
+
+def _payload_digest(payload: Any) -> bytes:
+    """Return a compact digest of a JSON-compatible API payload."""
+    encoded = orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+class UuidIndexMixin:
+    """Coordinator mixin indexing list data by item UUID."""
+
+    data: Any
+    _uuid_indexes: dict[str, tuple[Any, dict[str, dict[str, Any]]]]
+
+    def uuid_index(self, key: str) -> dict[str, dict[str, Any]]:
+        """Return the items of a list in the data keyed by their UUID.
+
+        The index is only rebuilt when the list it was built from is replaced,
+        so entities can look up their item instead of scanning the list.
+        """
+        items = self.data.get(key) or ()
+        cached = self._uuid_indexes.get(key)
+        if cached is not None and cached[0] is items:
+            return cached[1]
+
+        index = index_by_uuid(items)
+        self._uuid_indexes[key] = (items, index)
+        return index
+
+
+class ProPresenterCoordinator(UuidIndexMixin, DataUpdateCoordinator):
     """ProPresenter coordinator - handles infrequently changing data via polling (firmware, name, etc)."""
 
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
@@ -28,6 +234,15 @@ class ProPresenterCoordinator(DataUpdateCoordinator):
         self._last_known_version = (
             None  # Track version to only update device info when it changes
         )
+        # Digest of each polled endpoint, used to back off polling while nothing changes
+        self._poll_digests: dict[str, bytes] = {}
+        self._base_update_interval = timedelta(seconds=STATIC_SCAN_INTERVAL)
+        self._max_update_interval = timedelta(seconds=MAX_STATIC_SCAN_INTERVAL)
+        # Bound playlist detail fan-out so a large library doesn't flood ProPresenter
+        self._detail_semaphore = asyncio.Semaphore(DETAIL_FETCH_CONCURRENCY)
+        # Playlist item indexes with the details list each was built from
+        self._item_indexes: dict[str, tuple[Any, PlaylistItemIndex]] = {}
+        self._uuid_indexes = {}  # See UuidIndexMixin.uuid_index()
 
         # Get configuration values
         host = config_entry.data[CONF_HOST]
@@ -36,6 +251,21 @@ class ProPresenterCoordinator(DataUpdateCoordinator):
         # Initialize API
         self.api = ProPresenterAPI(host, port)
 
+        # Bind polled endpoints once instead of resolving them on every poll
+        self._get_version = self.api.get_version
+        self._get_clear_groups = self.api.get_clear_groups
+        self._get_macros = self.api.get_macros
+        self._get_timers = self.api.get_timers
+        self._get_video_inputs = self.api.get_video_inputs
+        self._get_presentation_playlists = self.api.get_presentation_playlists
+        self._get_presentation_playlist_details = (
+            self.api.get_presentation_playlist_details
+        )
+        self._get_audio_playlists = self.api.get_audio_playlists
+        self._get_audio_playlist_details = self.api.get_audio_playlist_details
+        self._get_media_playlists = self.api.get_media_playlists
+        self._get_media_playlist_details = self.api.get_media_playlist_details
+
         # Initialize DataUpdateCoordinator with longer interval for static data
         # Dynamic data will be handled by streaming
         super().__init__(
@@ -43,9 +273,8 @@ class ProPresenterCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=f"{DOMAIN} ({host}:{port})",
             update_method=self.async_update_data,
-            update_interval=timedelta(
-                seconds=30
-            ),  # Poll static data like version every 30 seconds
+            # Poll static data like version every 30 seconds, backing off while unchanged
+            update_interval=self._base_update_interval,
         )
 
     async def async_update_data(self) -> dict[str, Any]:
@@ -57,98 +286,157 @@ class ProPresenterCoordinator(DataUpdateCoordinator):
         """
         try:
             # Version info - truly static (only changes on PP upgrade)
-            version_info = await self.api.get_version()
+            version_info = await self._get_version()
 
             # Clear groups - rarely change (only when user adds/removes in PP)
-            clear_groups = await self.api.get_clear_groups()
+            clear_groups = await self._get_clear_groups()
 
             # Macros - rarely change (only when user creates/deletes)
-            macros = await self.api.get_macros()
+            macros = await self._get_macros()
+
+            # Playlist details are only cached once every playlist's details
+            # arrived, so playlists that timed out are retried on the next poll
+            details_complete = True
 
             # Presentation playlist structure - cache on first fetch
             # Only re-fetch if not in cache (user can call refresh service)
-            if not hasattr(self, "_cached_presentation_playlists"):
-                presentation_playlists = await self.api.get_presentation_playlists()
+            if hasattr(self, "_cached_presentation_playlists"):
+                presentation_playlists = self._cached_presentation_playlists
+                presentation_playlist_details_list = (
+                    self._cached_presentation_playlist_details
+                )
+            else:
+                presentation_playlists = await self._get_presentation_playlists()
                 # Collect all playlist UUIDs (including nested ones)
                 playlist_uuids = []
                 collect_playlist_uuids(presentation_playlists, playlist_uuids)
 
                 # Fetch details for all playlists ONCE
-                presentation_playlist_details_list = []
-                for playlist_uuid in playlist_uuids:
-                    details = await self.api.get_presentation_playlist_details(
-                        playlist_uuid
+                results = await asyncio.gather(
+                    *(
+                        self._fetch_details(
+                            self._get_presentation_playlist_details, playlist_uuid
+                        )
+                        for playlist_uuid in playlist_uuids
                     )
-                    if details:
-                        presentation_playlist_details_list.append(details)
-
-                self._cached_presentation_playlists = presentation_playlists
-                self._cached_presentation_playlist_details = (
-                    presentation_playlist_details_list
                 )
+                presentation_playlist_details_list = [
+                    details
+                    for details in results
+                    if details and details is not _DETAILS_TIMED_OUT
+                ]
+
+                if _DETAILS_TIMED_OUT in results:
+                    details_complete = False
+                else:
+                    self._cached_presentation_playlists = presentation_playlists
+                    self._cached_presentation_playlist_details = (
+                        presentation_playlist_details_list
+                    )
 
             # Audio playlist structure - cache on first fetch
-            if not hasattr(self, "_cached_audio_playlists"):
-                audio_playlists = await self.api.get_audio_playlists()
+            if hasattr(self, "_cached_audio_playlists"):
+                audio_playlists = self._cached_audio_playlists
+                audio_playlist_details_list = self._cached_audio_playlist_details
+            else:
+                audio_playlists = await self._get_audio_playlists()
                 audio_playlist_details_list = []
+                results = []
                 if audio_playlists and isinstance(audio_playlists, list):
-                    for playlist in audio_playlists:
-                        playlist_id = playlist.get("id", {})
-                        playlist_uuid = playlist_id.get("uuid")
-                        if playlist_uuid:
-                            details = await self.api.get_audio_playlist_details(
-                                playlist_uuid
+                    playlist_uuids = [
+                        playlist_uuid
+                        for playlist_uuid in map(_playlist_uuid, audio_playlists)
+                        if playlist_uuid
+                    ]
+                    results = await asyncio.gather(
+                        *(
+                            self._fetch_details(
+                                self._get_audio_playlist_details, playlist_uuid
                             )
-                            if details:
-                                audio_playlist_details_list.append(details)
-
-                self._cached_audio_playlists = audio_playlists
-                self._cached_audio_playlist_details = audio_playlist_details_list
+                            for playlist_uuid in playlist_uuids
+                        )
+                    )
+                    audio_playlist_details_list = [
+                        details
+                        for details in results
+                        if details and details is not _DETAILS_TIMED_OUT
+                    ]
+
+                if _DETAILS_TIMED_OUT in results:
+                    details_complete = False
+                else:
+                    self._cached_audio_playlists = audio_playlists
+                    self._cached_audio_playlist_details = audio_playlist_details_list
 
             # Media playlist structure - cache on first fetch
-            if not hasattr(self, "_cached_media_playlists"):
-                media_playlists = await self.api.get_media_playlists()
+            if hasattr(self, "_cached_media_playlists"):
+                media_playlists = self._cached_media_playlists
+                media_playlist_details_list = self._cached_media_playlist_details
+            else:
+                media_playlists = await self._get_media_playlists()
                 media_playlist_details_list = []
+                results = []
                 if media_playlists and isinstance(media_playlists, list):
-                    for playlist in media_playlists:
-                        playlist_id = playlist.get("id", {})
-                        playlist_uuid = playlist_id.get("uuid")
-                        if playlist_uuid:
-                            try:
-                                details = await self.api.get_media_playlist_details(
-                                    playlist_uuid
-                                )
-                                if details:
-                                    media_playlist_details_list.append(details)
-                            except Exception as e:
-                                _LOGGER.debug(
-                                    "Could not fetch media playlist details for %s: %s",
-                                    playlist_uuid,
-                                    e,
-                                )
-
-                self._cached_media_playlists = media_playlists
-                self._cached_media_playlist_details = media_playlist_details_list
+                    playlist_uuids = [
+                        playlist_uuid
+                        for playlist_uuid in map(_playlist_uuid, media_playlists)
+                        if playlist_uuid
+                    ]
+                    results = await asyncio.gather(
+                        *(
+                            self._fetch_details(
+                                self._get_media_playlist_details, playlist_uuid
+                            )
+                            for playlist_uuid in playlist_uuids
+                        ),
+                        return_exceptions=True,
+                    )
+                    for playlist_uuid, details in zip(
+                        playlist_uuids, results, strict=True
+                    ):
+                        if isinstance(details, Exception):
+                            _LOGGER.debug(
+                                "Could not fetch media playlist details for %s: %s",
+                                playlist_uuid,
+                                details,
+                            )
+                        elif details and details is not _DETAILS_TIMED_OUT:
+                            media_playlist_details_list.append(details)
+
+                if _DETAILS_TIMED_OUT in results:
+                    details_complete = False
+                else:
+                    self._cached_media_playlists = media_playlists
+                    self._cached_media_playlist_details = media_playlist_details_list
 
             # Fetch timers
-            timers = await self.api.get_timers() or []
+            timers = await self._get_timers() or []
 
             # Fetch video inputs
-            video_inputs = await self.api.get_video_inputs() or []
+            video_inputs = await self._get_video_inputs() or []
 
-            data = {
+            polled = {
                 "version": version_info,
                 "clear_groups": clear_groups,
                 "macros": macros,
                 "timers": timers,
                 "video_inputs": video_inputs,
+            }
+            self._adjust_update_interval(polled)
+            if not details_complete:
+                # Retry the missing playlist details without backing off
+                self.reset_update_interval()
+
+            data = {
+                **polled,
+                "update_interval": self.update_interval.total_seconds(),
                 # Return cached playlist data
-                "presentation_playlists": self._cached_presentation_playlists,
-                "presentation_playlist_details_list": self._cached_presentation_playlist_details,
-                "audio_playlists": self._cached_audio_playlists,
-                "audio_playlist_details_list": self._cached_audio_playlist_details,
-                "media_playlists": self._cached_media_playlists,
-                "media_playlist_details_list": self._cached_media_playlist_details,
+                "presentation_playlists": presentation_playlists,
+                "presentation_playlist_details_list": presentation_playlist_details_list,
+                "audio_playlists": audio_playlists,
+                "audio_playlist_details_list": audio_playlist_details_list,
+                "media_playlists": media_playlists,
+                "media_playlist_details_list": media_playlist_details_list,
             }
             # Cache the successful data
             self._data = data
@@ -161,6 +449,49 @@ class ProPresenterCoordinator(DataUpdateCoordinator):
         except ProPresenterConnectionError as err:
             raise UpdateFailed(f"Error communicating with ProPresenter: {err}") from err
 
+    async def _fetch_details(
+        self,
+        fetch: Callable[[str], Awaitable[dict[str, Any] | None]],
+        playlist_uuid: str,
+    ) -> dict[str, Any] | object | None:
+        """Fetch one playlist's details, or _DETAILS_TIMED_OUT if it is too slow.
+
+        The semaphore permit is released on timeout so one stalled playlist
+        cannot hold up the rest of the fan-out.
+        """
+        async with self._detail_semaphore:
+            try:
+                return await asyncio.wait_for(
+                    fetch(playlist_uuid), timeout=DETAIL_FETCH_TIMEOUT
+                )
+            except TimeoutError:
+                _LOGGER.warning(
+                    "Timed out fetching playlist details for %s, retrying next poll",
+                    playlist_uuid,
+                )
+                return _DETAILS_TIMED_OUT
+
+    def _adjust_update_interval(self, polled: dict[str, Any]) -> None:
+        """Back off the poll interval while polled payloads stay identical.
+
+        Each unchanged poll multiplies the interval by STATIC_SCAN_BACKOFF up to
+        MAX_STATIC_SCAN_INTERVAL. Any change resets it to the base interval.
+        DataUpdateCoordinator reads update_interval when scheduling the next poll.
+        """
+        changed = False
+        for key, payload in polled.items():
+            digest = _payload_digest(payload)
+            if self._poll_digests.get(key) != digest:
+                self._poll_digests[key] = digest
+                changed = True
+
+        if changed:
+            self.update_interval = self._base_update_interval
+        else:
+            self.update_interval = min(
+                self.update_interval * STATIC_SCAN_BACKOFF, self._max_update_interval
+            )
+
     async def async_shutdown(self) -> None:
         """Close API connection on shutdown."""
         await self.api.close()
@@ -198,8 +529,29 @@ class ProPresenterCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.debug(f"Could not update device registry: {err}")
 
+    def playlist_item_index(self, key: str) -> PlaylistItemIndex:
+        """Return the item index of a playlist details list in the data.
+
+        Playlist details are cached until invalidated, so the index is only
+        rebuilt when the list it was built from is replaced.
+        """
+        details_list = self.data.get(key) or ()
+        cached = self._item_indexes.get(key)
+        if cached is not None and cached[0] is details_list:
+            return cached[1]
+
+        index = build_playlist_item_index(details_list, **_ITEM_INDEX_OPTIONS[key])
+        self._item_indexes[key] = (details_list, index)
+        return index
+
+    def reset_update_interval(self) -> None:
+        """Poll at the base rate again, dropping any unchanged-data backoff."""
+        self.update_interval = self._base_update_interval
+
     def invalidate_playlist_cache(self) -> None:
         """Invalidate cached playlist data to force refresh on next poll."""
+        # Poll at the base rate again so refreshed data is picked up promptly
+        self.reset_update_interval()
         if hasattr(self, "_cached_presentation_playlists"):
             delattr(self, "_cached_presentation_playlists")
         if hasattr(self, "_cached_presentation_playlist_details"):
@@ -214,7 +566,9 @@ class ProPresenterCoordinator(DataUpdateCoordinator):
             delattr(self, "_cached_media_playlist_details")
 
 
-class ProPresenterStreamingCoordinator(DataUpdateCoordinator):
+class ProPresenterStreamingCoordinator(
+    UuidIndexMixin, DataUpdateCoordinator[ProPresenterStreamingData]
+):
     """Streaming coordinator for frequently changing ProPresenter data."""
 
     def __init__(
@@ -227,17 +581,55 @@ class ProPresenterStreamingCoordinator(DataUpdateCoordinator):
         self.hass = hass
         self.api = api
         self.static_coordinator = static_coordinator
-        self._stream_task = None
-        self._poll_task = None
+        self._supervisor_task: asyncio.Task | None = None
+        self._streaming = False  # Guarded by _streaming_lock
+        self._streaming_lock = asyncio.Lock()
         self.connected = False  # Track connection state globally
         self._last_logged_error = None  # Track last error to avoid log spam
         self._error_count = 0  # Count consecutive errors
+        self._reconnect_delay = STREAM_RECONNECT_DELAY  # Grows while reconnects fail
+        self._notify_handle: asyncio.TimerHandle | None = None  # Pending notify
+        # Data keys changed since the last notification; see is_dirty()
+        self._dirty_keys: set[str] = set()
+        self._last_dirty: frozenset[str] | None = None
+        # Incremented whenever a data key changes, so entities can memoize
+        # values derived from the data
+        self.data_version = 0
+        self._uuid_indexes = {}  # See UuidIndexMixin.uuid_index()
+        # Stage layout index with the data lists it was built from
+        self._stage_layout_index: tuple[tuple, StageLayoutIndex] | None = None
+        # Active media playlist polling backs off while unchanged
+        self._active_playlist_interval = ACTIVE_PLAYLIST_POLL_INTERVAL
+        self._active_playlist_nudge = asyncio.Event()  # Wakes the poll loop early
+        self._active_media_digest: bytes | None = None
+        # Track which keys the stream's initial snapshot has delivered
+        self._initial_data_loaded = False
+        self._snapshot_seen: set[str] = set()
+        self._initial_snapshot_event = asyncio.Event()
+        # Initial REST fetchers, used for anything the stream snapshot doesn't cover
+        self._initial_fetchers = {
+            "active_presentation": api.get_active_presentation,
+            "stage_screens": api.get_stage_screens,
+            "stage_layouts": api.get_stage_layouts,
+            "layout_map": api.get_stage_layout_map,
+            "messages": api.get_messages,
+            "props": api.get_props,
+            "looks": api.get_looks,
+            "current_look": api.get_current_look,
+            "status_layers": api.get_status_layers,
+            "audience_screens_status": api.get_audience_screens_status,
+            "stage_screens_status": api.get_stage_screens_status,
+            "stage_message": api.get_stage_message,
+            "audio_transport_state": api.get_audio_transport_state,
+            "presentation_transport_state": api.get_presentation_transport_state,
+            "active_media_playlist": api.get_active_media_playlist,
+        }
 
         # Set reference back to static coordinator
         if static_coordinator:
             static_coordinator.streaming_coordinator = self
 
-        self._data = {
+        self._data: ProPresenterStreamingData = {
             "active_presentation": {},
             "stage_screens": [],
             "stage_layouts": [],
@@ -269,201 +661,203 @@ class ProPresenterStreamingCoordinator(DataUpdateCoordinator):
             update_method=self.async_update_data,
         )
 
-    async def async_update_data(self) -> dict[str, Any]:
+    async def async_update_data(self) -> ProPresenterStreamingData:
         """Fetch initial data on first load, then return cached data from streaming updates."""
-        # If data is still at initial state, fetch it once
-        # Check if we haven't loaded messages yet (they should always be fetched initially)
-        if not self._data.get("messages"):
+        if not self._initial_data_loaded:
+            # The stream sends the current value of each subscribed path when it
+            # connects, so wait briefly for that snapshot and only fetch the rest
+            try:
+                await asyncio.wait_for(
+                    self._initial_snapshot_event.wait(),
+                    timeout=INITIAL_SNAPSHOT_TIMEOUT,
+                )
+            except TimeoutError:
+                _LOGGER.debug(
+                    "Stream snapshot incomplete, fetching missing data: %s",
+                    sorted(_SNAPSHOT_KEYS - self._snapshot_seen),
+                )
+
+            keys = [
+                key for key in self._initial_fetchers if key not in self._snapshot_seen
+            ]
             try:
-                # Fetch all initial data in parallel for faster startup
+                # Fetch remaining initial data in parallel for faster startup
                 results = await asyncio.gather(
-                    self.api.get_active_presentation(),
-                    self.api.get_stage_screens(),
-                    self.api.get_stage_layouts(),
-                    self.api.get_stage_layout_map(),
-                    self.api.get_messages(),
-                    self.api.get_props(),
-                    self.api.get_looks(),
-                    self.api.get_current_look(),
-                    self.api.get_status_layers(),
-                    self.api.get_audience_screens_status(),
-                    self.api.get_stage_screens_status(),
-                    self.api.get_stage_message(),
-                    self.api.get_audio_transport_state(),
-                    self.api.get_presentation_transport_state(),
-                    self.api.get_active_media_playlist(),
+                    *(self._initial_fetchers[key]() for key in keys),
                     return_exceptions=True,
                 )
 
                 # Unpack results (handle None values and exceptions)
-                keys = [
-                    "active_presentation",
-                    "stage_screens",
-                    "stage_layouts",
-                    "layout_map",
-                    "messages",
-                    "props",
-                    "looks",
-                    "current_look",
-                    "status_layers",
-                    "audience_screens_status",
-                    "stage_screens_status",
-                    "stage_message",
-                    "audio_transport_state",
-                    "presentation_transport_state",
-                    "active_media_playlist",
-                ]
-
-                for i, key in enumerate(keys):
-                    result = results[i]
+                for key, result in zip(keys, results, strict=True):
+                    if key in self._snapshot_seen:
+                        # The stream delivered this key while the fetch ran,
+                        # so the fetched value may be older
+                        continue
                     if isinstance(result, Exception):
                         _LOGGER.warning(
                             "Failed to fetch %s during startup: %s", key, result
                         )
-                        self._data[key] = (
-                            {}
-                            if key
-                            in [
-                                "active_presentation",
-                                "current_look",
-                                "audio_transport_state",
-                                "presentation_transport_state",
-                                "active_media_playlist",
-                                "stage_message",
-                            ]
-                            else []
-                        )
-                    else:
-                        self._data[key] = result or (
-                            {}
-                            if key
-                            in [
-                                "active_presentation",
-                                "current_look",
-                                "audio_transport_state",
-                                "presentation_transport_state",
-                                "active_media_playlist",
-                                "stage_message",
-                            ]
-                            else []
-                        )
+                        result = None
+                    if result and key in _STREAM_NORMALIZERS:
+                        result = _STREAM_NORMALIZERS[key](result)
+                    self._data[key] = result or _STREAM_DEFAULT.get(key, list)()
+                self.data_version += 1
 
             except Exception as err:
                 raise UpdateFailed(f"Error fetching initial data: {err}")
 
+            self._initial_data_loaded = True
+
         return self._data
 
     async def _handle_status_update(self, path: str, data: Any) -> None:
         """Handle incoming status update from stream."""
         # Update data dictionary based on path (no logging for performance)
-        if path == "presentation/current" or path == "presentation/active":
-            self._data["active_presentation"] = data
-        elif path == "presentation/slide_index":
-            self._data["slide_index"] = data
-        elif path == "announcement/slide_index":
-            self._data["announcement_slide_index"] = data
-        elif path == "stage/screens":
-            self._data["stage_screens"] = data
-        elif path == "stage/layouts":
-            self._data["stage_layouts"] = data
-        elif path == "stage/layout_map":
-            self._data["layout_map"] = data
-        elif path == "messages":
-            self._data["messages"] = data
-        elif path == "props":
-            self._data["props"] = data
-        elif path == "looks":
-            self._data["looks"] = data
-        elif path == "look/current":
-            self._data["current_look"] = data
-        elif path == "status/layers":
-            self._data["status_layers"] = data
-        elif path == "status/audience_screens":
-            self._data["audience_screens_status"] = data
-        elif path == "status/stage_screens":
-            self._data["stage_screens_status"] = data
-        elif path == "capture/status":
-            self._data["capture_status"] = data
-        elif path == "timers":
-            self._data["timers"] = data
-        elif path == "timers/current":
-            self._data["timers_current"] = data
-        elif path == "transport/audio/current":
-            self._data["audio_transport_state"] = data
-        elif path == "transport/audio/time":
-            self._data["audio_transport_time"] = data
-        elif path == "transport/presentation/current":
-            self._data["presentation_transport_state"] = data
-        elif path == "transport/presentation/time":
-            self._data["presentation_transport_time"] = data
-        elif path == "stage/message":
-            self._data["stage_message"] = data
+        key = _STREAM_PATH_TO_KEY.get(path)
+        if key is None:
+            return
+        if key in _STREAM_NORMALIZERS:
+            data = _STREAM_NORMALIZERS[key](data)
+        # Keep tracking streamed keys until the initial REST results are stored
+        if not self._initial_data_loaded:
+            self._snapshot_seen.add(key)
+            if self._snapshot_seen >= _SNAPSHOT_KEYS:
+                self._initial_snapshot_event.set()
+        # Skip repeated payloads (e.g. transport time while paused)
+        store = self._data
+        if store.get(key, _MISSING) == data:
+            return
+        store[key] = data
+        self._dirty_keys.add(key)
+        self.data_version += 1
+
+        if key in _ACTIVE_PLAYLIST_NUDGE_KEYS:
+            self._active_playlist_nudge.set()
 
         # Notify listeners that data has changed
-        self.async_set_updated_data(self._data)
+        if path in _IMMEDIATE_NOTIFY_PATHS:
+            self._flush_notify()
+        else:
+            self._schedule_notify()
+
+    @callback
+    def _schedule_notify(self) -> None:
+        """Coalesce listener notifications for high-frequency stream events."""
+        if self._notify_handle is None:
+            self._notify_handle = self.hass.loop.call_later(
+                STREAM_NOTIFY_DELAY, self._flush_notify
+            )
 
-    async def start_streaming(self) -> None:
-        """Start the streaming connection."""
-        if self._stream_task and not self._stream_task.done():
-            return
+    @callback
+    def _flush_notify(self) -> None:
+        """Notify listeners now, dropping any pending coalesced notification."""
+        if self._notify_handle is not None:
+            self._notify_handle.cancel()
+            self._notify_handle = None
+        # Expose the changed keys only while listeners run; any other
+        # notification (refresh, connection change) reports everything dirty.
+        # So does one that makes the coordinator available again, so entities
+        # skipping unrelated keys still write their availability.
+        self._last_dirty = (
+            frozenset(self._dirty_keys) if self.last_update_success else None
+        )
+        self._dirty_keys.clear()
+        try:
+            self.async_set_updated_data(self._data)
+        finally:
+            self._last_dirty = None
 
-        # Create background tasks that don't block HA startup
-        # Using asyncio.create_task instead of hass.async_create_task
-        # so HA doesn't wait for them during startup
-        self._stream_task = asyncio.create_task(self._run_stream())
+    def stage_layout_index(self) -> StageLayoutIndex:
+        """Return the index of the stage screens, layouts and assignments.
 
-        # Start polling task for active media playlist
-        self._poll_task = asyncio.create_task(self._poll_active_playlist())
+        The index is shared by all stage layout selects and only rebuilt when
+        the stage screens, stage layouts or layout map are replaced.
+        """
+        sources = tuple(self.data.get(key) or () for key in _STAGE_LAYOUT_INDEX_KEYS)
+        cached = self._stage_layout_index
+        if cached is not None and all(
+            source is cached_source
+            for source, cached_source in zip(sources, cached[0], strict=True)
+        ):
+            return cached[1]
+
+        index = build_stage_layout_index(*sources)
+        self._stage_layout_index = (sources, index)
+        return index
+
+    def is_dirty(self, *keys: str) -> bool:
+        """Return True if any of the data keys changed in the current notification.
+
+        Listeners can use this to skip work when unrelated data changed.
+        Outside a stream notification every key is reported as dirty.
+        """
+        if self._last_dirty is None:
+            return True
+        return not self._last_dirty.isdisjoint(keys)
+
+    async def start_streaming(self) -> None:
+        """Start the streaming connection."""
+        async with self._streaming_lock:
+            if self._streaming:
+                return
+            self._streaming = True
+
+            # Create a background task that doesn't block HA startup
+            # Using asyncio.create_task instead of hass.async_create_task
+            # so HA doesn't wait for it during startup
+            self._supervisor_task = asyncio.create_task(self._supervise())
+
+    async def _supervise(self) -> None:
+        """Run the stream and the active media playlist poll as one task group."""
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._run_stream())
+            tg.create_task(self._poll_active_playlist())
 
     async def _poll_active_playlist(self) -> None:
-        """Poll for active media playlist changes"""
+        """Poll for active media playlist changes.
+
+        The active media playlist is not available via streaming. The poll
+        interval grows while the playlist stays the same and resets on change;
+        presentation stream events wake the loop to re-check immediately.
+        """
         while True:
             try:
-                await asyncio.sleep(2)  # Poll every 2 seconds
+                try:
+                    await asyncio.wait_for(
+                        self._active_playlist_nudge.wait(),
+                        timeout=self._active_playlist_interval,
+                    )
+                except TimeoutError:
+                    pass
+                self._active_playlist_nudge.clear()
+
                 active_media = await self.api.get_active_media_playlist() or {}
 
-                # Only update if it changed
-                if active_media != self._data.get("active_media_playlist"):
+                # Only update if it changed (compare digests, not nested dicts)
+                digest = _payload_digest(active_media)
+                if digest != self._active_media_digest:
+                    self._active_media_digest = digest
                     self._data["active_media_playlist"] = active_media
-                    self.async_set_updated_data(self._data)
+                    self._dirty_keys.add("active_media_playlist")
+                    self.data_version += 1
+                    self._active_playlist_interval = ACTIVE_PLAYLIST_POLL_INTERVAL
+                    self._flush_notify()
+                else:
+                    self._active_playlist_interval = min(
+                        self._active_playlist_interval * ACTIVE_PLAYLIST_POLL_BACKOFF,
+                        MAX_ACTIVE_PLAYLIST_POLL_INTERVAL,
+                    )
             except Exception:
                 await asyncio.sleep(5)
 
     async def _run_stream(self) -> None:
         """Run the streaming connection (with auto-reconnect)."""
-        reconnect_delay = 5  # Start with 5 second delay
-        max_reconnect_delay = 30  # Max 30 seconds between attempts
-
         while True:
             try:
-                # Reset delay on successful connection
-                reconnect_delay = 5
-
                 await self.api.stream_status_updates(
-                    [
-                        "presentation/current",
-                        "presentation/slide_index",
-                        "announcement/slide_index",
-                        "stage/screens",
-                        "stage/layouts",
-                        "stage/layout_map",
-                        "messages",
-                        "props",  # Props stream (no polling)
-                        "looks",  # Looks stream (no polling)
-                        "look/current",  # Current look streams
-                        "status/layers",
-                        "status/audience_screens",
-                        "status/stage_screens",
-                        "capture/status",  # Capture status streams
-                        "timers",  # Timer configurations stream
-                        "timers/current",  # Timer states stream
-                        "transport/audio/current",  # Audio transport state
-                        "transport/audio/time",  # Audio transport time
-                        "transport/presentation/current",  # Media/video transport state
-                        "transport/presentation/time",  # Media/video transport time
-                        "stage/message",
-                    ],
+                    _STREAM_PATHS,
                     self._handle_status_update,
+                    on_connected=self._on_stream_connected,
                 )
                 # If we get here, stream connected successfully
                 self.connected = True
@@ -518,36 +912,60 @@ class ProPresenterStreamingCoordinator(DataUpdateCoordinator):
                     _LOGGER.warning(
                         "Stream disconnected: %s. Reconnecting in %d seconds...%s",
                         error_msg,
-                        reconnect_delay,
+                        self._reconnect_delay,
                         version_hint,
                     )
 
-                # Mark entities as unavailable when disconnected
-                self.connected = False
-                self.last_update_success = False
-                self.async_update_listeners()
-                # Also mark static coordinator unavailable
-                if self.static_coordinator:
-                    self.static_coordinator.last_update_success = False
-                    self.static_coordinator.async_update_listeners()
+                self._mark_unavailable()
 
-                await asyncio.sleep(reconnect_delay)
+                # Jitter decorrelates reconnects from multiple clients after a restart
+                await asyncio.sleep(self._reconnect_delay * random.uniform(0.8, 1.2))
 
                 # Exponential backoff for reconnection attempts
-                reconnect_delay = min(reconnect_delay * 1.5, max_reconnect_delay)
+                self._reconnect_delay = min(
+                    self._reconnect_delay * 1.5, MAX_STREAM_RECONNECT_DELAY
+                )
+
+    def _mark_unavailable(self) -> None:
+        """Mark entities of both coordinators as unavailable when disconnected."""
+        self.connected = False
+        self.last_update_success = False
+        self.async_update_listeners()
+        # Also mark static coordinator unavailable
+        if self.static_coordinator:
+            self.static_coordinator.last_update_success = False
+            self.static_coordinator.async_update_listeners()
+
+    def _on_stream_connected(self) -> None:
+        """Reset the reconnect backoff and restore availability on connect.
+
+        The snapshot resent on reconnect usually matches the stored data and is
+        skipped, so availability can't wait for the next changed payload.
+        """
+        self._reconnect_delay = STREAM_RECONNECT_DELAY
+        if not self.connected or not self.last_update_success:
+            self.connected = True
+            self.last_update_success = True
+            self.async_update_listeners()
+        # A disconnect also marked the static coordinator unavailable; poll it now
+        # rather than after a backed-off interval
+        static_coordinator = self.static_coordinator
+        if static_coordinator and not static_coordinator.last_update_success:
+            static_coordinator.reset_update_interval()
+            self.hass.async_create_task(static_coordinator.async_request_refresh())
 
     async def async_shutdown(self) -> None:
         """Stop the streaming connection."""
-        if self._stream_task and not self._stream_task.done():
-            self._stream_task.cancel()
-            try:
-                await self._stream_task
-            except asyncio.CancelledError:
-                pass
-
-        if self._poll_task and not self._poll_task.done():
-            self._poll_task.cancel()
-            try:
-                await self._poll_task
-            except asyncio.CancelledError:
-                pass
+        if self._notify_handle is not None:
+            self._notify_handle.cancel()
+            self._notify_handle = None
+
+        async with self._streaming_lock:
+            if self._supervisor_task and not self._supervisor_task.done():
+                self._supervisor_task.cancel()
+                try:
+                    await self._supervisor_task
+                except asyncio.CancelledError:
+                    pass
+            self._supervisor_task = None
+            self._streaming = False
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 from datetime import datetime
-from io import BytesIO
+from functools import lru_cache
 import logging
+from math import gcd
+import time
+from typing import Any
 
 from homeassistant.components.image import ImageEntity
 from homeassistant.config_entries import ConfigEntry
@@ -12,28 +17,289 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
+from .api import ProPresenterAPI
 from .base import ProPresenterBaseEntity
+from .const import CONF_THUMBNAIL_QUALITY, DEFAULT_THUMBNAIL_QUALITY
 from .coordinator import ProPresenterCoordinator, ProPresenterStreamingCoordinator
-from .utils import get_nested_value
 
 _LOGGER = logging.getLogger(__name__)
 
-
+# Slide thumbnails shared by all image entities, keyed on
+# (ProPresenter base URL, presentation UUID, slide index, quality)
+THUMBNAIL_CACHE_SIZE = 64
+# Cached thumbnails are revalidated (or refetched, without HTTP validators)
+# after this many seconds
+THUMBNAIL_REVALIDATE_AFTER = 60
+# (image data, ETag, Last-Modified, monotonic time fetched or revalidated)
+_thumbnail_cache: OrderedDict[
+    tuple[str, str, int, int], tuple[bytes, str | None, str | None, float]
+] = OrderedDict()
+# Fetches in progress, so concurrent requests for one thumbnail share a single call
+_thumbnail_inflight: dict[tuple[str, str, int, int], asyncio.Task[bytes | None]] = {}
+
+# Slide notes by slide index, shared by all image entities and keyed on
+# (ProPresenter base URL, presentation UUID)
+NOTES_CACHE_SIZE = 8
+# Cached notes are refetched after this many seconds, so edits are picked up
+NOTES_REFETCH_AFTER = 60
+# (notes by slide index, monotonic time fetched)
+_slide_notes_cache: OrderedDict[tuple[str, str], tuple[list[str], float]] = (
+    OrderedDict()
+)
+_slide_notes_inflight: dict[tuple[str, str], asyncio.Task[list[str] | None]] = {}
+
+
+# A solid frame only has DC coefficients, so a flat table loses nothing
+_QUANT_TABLE = bytes([1] * 64)
+_EOB = 0x00  # AC end-of-block symbol
+
+
+def _jpeg_segment(marker: int, payload: bytes) -> bytes:
+    """Return a JPEG marker segment with its length prefix."""
+    return bytes((0xFF, marker)) + (len(payload) + 2).to_bytes(2, "big") + payload
+
+
+def _huffman_codes(counts: tuple[int, ...], symbols: bytes) -> dict[int, str]:
+    """Return the canonical Huffman code of each symbol as a bit string."""
+    codes = {}
+    code = 0
+    symbol_iter = iter(symbols)
+    for length, count in enumerate(counts, start=1):
+        for _ in range(count):
+            codes[next(symbol_iter)] = format(code, f"0{length}b")
+            code += 1
+        code <<= 1
+    return codes
+
+
+def _pack_bits(bits: str) -> bytes:
+    """Pack a bit string into entropy-coded bytes, padding the end with 1s."""
+    bits += "1" * (-len(bits) % 8)
+    if not bits:
+        return b""
+    return int(bits, 2).to_bytes(len(bits) // 8, "big").replace(b"\xff", b"\xff\x00")
+
+
+@lru_cache(maxsize=4)
 def create_black_image(width: int = 1920, height: int = 1080) -> bytes:
-    """Create a black JPEG image of specified dimensions."""
-    try:
-        from PIL import Image
+    """Create a black JPEG image of specified dimensions.
+
+    The frame is written as a greyscale baseline JPEG directly, without an
+    image library. Every 8x8 block of a solid frame has only a DC coefficient,
+    so after the first block each one encodes as "DC unchanged" + end-of-block.
+    The Huffman tables are optimized for the only symbols used, which makes
+    those repeated blocks 2 bits each.
+    The result is memoized, so each size is only built once per process.
+    """
+    # Level-shifted black (0 - 128) scaled by the 8x8 DCT gives a DC of -1024
+    dc = round(-1024 / _QUANT_TABLE[0])
+    category = abs(dc).bit_length()
+
+    # (number of codes of each length 1-16, symbols in code order); no code
+    # may be all 1 bits, so the rarer DC symbol takes the 2-bit code "10"
+    dc_table = ((1, 1) + (0,) * 14, bytes((0, category)))
+    ac_table = ((1,) + (0,) * 15, bytes((_EOB,)))
+    dc_codes = _huffman_codes(*dc_table)
+    ac_codes = _huffman_codes(*ac_table)
+
+    amplitude = dc + (1 << category) - 1 if dc < 0 else dc
+    first_block = (
+        dc_codes[category] + format(amplitude, f"0{category}b") + ac_codes[_EOB]
+    )
+    block = dc_codes[0] + ac_codes[_EOB]
+    remaining = -(-width // 8) * -(-height // 8)
+
+    # Pack the first block, then whole byte runs of repeated blocks, then the
+    # leftover blocks, so no bit string the size of the frame is ever built
+    head = first_block
+    remaining -= 1
+    while len(head) % 8 and remaining:
+        head += block
+        remaining -= 1
+    period = 8 // gcd(len(block), 8)
+    runs, leftover = divmod(remaining, period)
+    scan = (
+        _pack_bits(head)
+        + _pack_bits(block * period) * runs
+        + _pack_bits(block * leftover)
+    )
+
+    return b"".join(
+        (
+            b"\xff\xd8",  # SOI
+            _jpeg_segment(0xE0, b"JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"),
+            _jpeg_segment(0xDB, b"\x00" + _QUANT_TABLE),
+            _jpeg_segment(
+                0xC0,
+                b"\x08"
+                + height.to_bytes(2, "big")
+                + width.to_bytes(2, "big")
+                + b"\x01\x01\x11\x00",
+            ),
+            _jpeg_segment(
+                0xC4,
+                b"\x00"
+                + bytes(dc_table[0])
+                + dc_table[1]
+                + b"\x10"
+                + bytes(ac_table[0])
+                + ac_table[1],
+            ),
+            _jpeg_segment(0xDA, b"\x01\x01\x00\x00\x3f\x00"),
+            scan,
+            b"\xff\xd9",  # EOI
+        )
+    )
+
+
+# Black frame shown while the slide layer is cleared (matches thumbnail size)
+_BLACK_JPEG_1080P = create_black_image(1920, 1080)
+
+
+async def _async_get_thumbnail(
+    api: ProPresenterAPI,
+    pres_uuid: str,
+    slide_index: int,
+    quality: int = DEFAULT_THUMBNAIL_QUALITY,
+) -> bytes | None:
+    """Return a slide thumbnail, fetching it only if no entity has it cached.
+
+    The current, next and previous slide entities overlap as slides advance,
+    so sharing one LRU cache avoids refetching the same thumbnail. Concurrent
+    requests for a thumbnail that is being fetched wait for that fetch.
+    Stale thumbnails are revalidated with a conditional GET when ProPresenter
+    sent validators for them and refetched otherwise, so edited slides are
+    picked up.
+    """
+    key = (api.base_url, pres_uuid, slide_index, quality)
+    entry = _thumbnail_cache.get(key)
+    if entry is not None:
+        _thumbnail_cache.move_to_end(key)
+        thumbnail_data, _, _, fetched = entry
+        if time.monotonic() - fetched < THUMBNAIL_REVALIDATE_AFTER:
+            return thumbnail_data
+
+    task = _thumbnail_inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_async_fetch_thumbnail(api, key))
+        _thumbnail_inflight[key] = task
+        task.add_done_callback(lambda _: _thumbnail_inflight.pop(key, None))
+    # Shield so one caller being cancelled doesn't cancel the shared fetch
+    return await asyncio.shield(task)
+
+
+async def _async_fetch_thumbnail(
+    api: ProPresenterAPI, key: tuple[str, str, int, int]
+) -> bytes | None:
+    """Fetch or revalidate a slide thumbnail and store it in the shared cache."""
+    _, pres_uuid, slide_index, quality = key
+    cached = _thumbnail_cache.get(key)
+    etag = last_modified = None
+    if cached is not None:
+        _, etag, last_modified, _ = cached
+
+    response = await api.get_presentation_thumbnail_conditional(
+        pres_uuid, slide_index, quality=quality, etag=etag, last_modified=last_modified
+    )
+    thumbnail_data, etag, last_modified = response
+    if thumbnail_data is None:
+        # Keep serving the cached copy if revalidation failed
+        return cached[0] if cached is not None else None
+    if not thumbnail_data and cached is not None:
+        # 304 Not Modified, keep the cached copy
+        thumbnail_data = cached[0]
+    if thumbnail_data:
+        _thumbnail_cache[key] = (thumbnail_data, etag, last_modified, time.monotonic())
+        if len(_thumbnail_cache) > THUMBNAIL_CACHE_SIZE:
+            _thumbnail_cache.popitem(last=False)
+    return thumbnail_data or None
+
+
+def _get_fresh_slide_notes(api: ProPresenterAPI, pres_uuid: str) -> list[str] | None:
+    """Return a presentation's cached notes, or None if missing or expired."""
+    key = (api.base_url, pres_uuid)
+    entry = _slide_notes_cache.get(key)
+    if entry is None:
+        return None
+    _slide_notes_cache.move_to_end(key)
+    notes, fetched = entry
+    if time.monotonic() - fetched >= NOTES_REFETCH_AFTER:
+        return None
+    return notes
+
+
+async def _async_get_slide_notes(
+    api: ProPresenterAPI, pres_uuid: str
+) -> list[str] | None:
+    """Return a presentation's notes by slide index, fetching details only once.
+
+    Concurrent requests for a presentation that is being fetched wait for
+    that fetch instead of issuing their own. Notes older than
+    NOTES_REFETCH_AFTER are fetched again.
+    """
+    notes = _get_fresh_slide_notes(api, pres_uuid)
+    if notes is not None:
+        return notes
+
+    key = (api.base_url, pres_uuid)
+    task = _slide_notes_inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_async_fetch_slide_notes(api, key))
+        _slide_notes_inflight[key] = task
+        task.add_done_callback(lambda _: _slide_notes_inflight.pop(key, None))
+    # Shield so one caller being cancelled doesn't cancel the shared fetch
+    return await asyncio.shield(task)
+
+
+async def _async_fetch_slide_notes(
+    api: ProPresenterAPI, key: tuple[str, str]
+) -> list[str] | None:
+    """Fetch presentation details and store its notes in the shared cache."""
+    pres_details = await api.get_presentation_details(key[1])
+    notes = _flatten_slide_notes(pres_details)
+    if notes is None:
+        # Missing details aren't cached, so the next request tries again
+        _slide_notes_cache.pop(key, None)
+        return None
+    _slide_notes_cache[key] = (notes, time.monotonic())
+    if len(_slide_notes_cache) > NOTES_CACHE_SIZE:
+        _slide_notes_cache.popitem(last=False)
+    return notes
 
-        # Create a black image
-        img = Image.new("RGB", (width, height), color="black")
 
-        # Convert to JPEG bytes
-        output = BytesIO()
-        img.save(output, format="JPEG", quality=95)
-        return output.getvalue()
-    except ImportError:
-        # Fallback to 1x1 black pixel if PIL not available
-        return b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00\xff\xdb\x00C\x00\x08\x06\x06\x07\x06\x05\x08\x07\x07\x07\t\t\x08\n\x0c\x14\r\x0c\x0b\x0b\x0c\x19\x12\x13\x0f\x14\x1d\x1a\x1f\x1e\x1d\x1a\x1c\x1c $.' \",#\x1c\x1c(7),01444\x1f'9=82<.342\xff\xc0\x00\x0b\x08\x00\x01\x00\x01\x01\x01\x11\x00\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\x04\x04\x00\x00\x01}\x01\x02\x03\x00\x04\x11\x05\x12!1A\x06\x13Qa\x07\"q\x142\x81\x91\xa1\x08#B\xb1\xc1\x15R\xd1\xf0$3br\x82\t\n\x16\x17\x18\x19\x1a%&'()*456789:CDEFGHIJSTUVWXYZcdefghijstuvwxyz\x83\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xda\x00\x08\x01\x01\x00\x00?\x00\xbf\xff\xd9"
+def _flatten_slide_notes(pres_details: dict | None) -> list[str] | None:
+    """Flatten presentation details into a list of notes by slide index."""
+    if not pres_details:
+        return None
+
+    presentation_data = pres_details.get("presentation", {})
+    return [
+        slide.get("notes") or slide.get("notes_html") or ""
+        for group in presentation_data.get("groups", [])
+        for slide in group.get("slides", [])
+    ]
+
+
+def _parse_slide_ref(
+    data: dict[str, Any], data_key: str, index_key: str
+) -> tuple[str | None, int | None, str] | None:
+    """Return (presentation UUID, slide index, presentation name) from stream data.
+
+    Returns None if the stream has no index info for this slide reference.
+    """
+    slide_index_data = data.get(data_key)
+    if not slide_index_data:
+        return None
+    index_info = slide_index_data.get(index_key)
+    if not index_info:
+        return None
+    # Direct lookups, this runs on every stream push for each image entity
+    presentation_id = index_info.get("presentation_id") or {}
+    return (
+        presentation_id.get("uuid"),
+        index_info.get("index"),
+        presentation_id.get("name", "Unknown"),
+    )
 
 
 async def async_setup_entry(
@@ -70,23 +336,38 @@ class SlideNotesMixin:
 
     def _init_notes_cache(self):
         """Initialize notes caching variables."""
-        self._cached_notes_pres_uuid: str | None = None
-        self._cached_notes_pres_details: dict | None = None
+        self._cached_notes_flat: list[str] | None = None  # Notes by slide index
         self._current_slide_notes: str | None = None
 
+    def _update_slide_notes(self, pres_uuid: str, slide_index: int) -> None:
+        """Update notes for a slide, fetching them if not freshly cached.
+
+        Notes still fresh in the shared cache are set synchronously, so the
+        caller's state write includes them. Otherwise (a new presentation, or
+        notes older than NOTES_REFETCH_AFTER) they are fetched in a task that
+        writes state when they arrive.
+        """
+        notes_flat = _get_fresh_slide_notes(self.api, pres_uuid)
+        if notes_flat is not None:
+            self._cached_notes_flat = notes_flat
+            self._current_slide_notes = self._extract_slide_notes(slide_index) or ""
+            return
+
+        self.hass.async_create_task(
+            self._async_fetch_slide_notes(pres_uuid, slide_index)
+        )
+
     async def _async_fetch_slide_notes(self, pres_uuid: str, slide_index: int) -> None:
         """Fetch presentation details and extract slide notes."""
         try:
-            # Only fetch presentation details if presentation changed
-            if pres_uuid != self._cached_notes_pres_uuid:
-                pres_details = await self.api.get_presentation_details(pres_uuid)
-                self._cached_notes_pres_uuid = pres_uuid
-                self._cached_notes_pres_details = pres_details
-            else:
-                pres_details = self._cached_notes_pres_details
+            # Served from the shared cache unless missing or expired; a failed
+            # fetch isn't cached, so the next slide change tries again
+            self._cached_notes_flat = await _async_get_slide_notes(
+                self.api, pres_uuid
+            )
 
             # Extract notes from cached presentation data
-            notes = self._extract_slide_notes(pres_details, slide_index)
+            notes = self._extract_slide_notes(slide_index)
             self._current_slide_notes = notes or ""
         except Exception as e:
             _LOGGER.debug("Error fetching slide notes: %s", e)
@@ -94,34 +375,72 @@ class SlideNotesMixin:
 
         self.async_write_ha_state()
 
-    def _extract_slide_notes(
-        self, pres_details: dict | None, slide_index: int
-    ) -> str | None:
-        """Extract slide notes from presentation details by slide index."""
-        if not pres_details:
+    def _extract_slide_notes(self, slide_index: int) -> str | None:
+        """Return the cached notes for a slide index."""
+        notes = self._cached_notes_flat
+        if notes is None or not 0 <= slide_index < len(notes):
             return None
+        return notes[slide_index]
 
-        presentation_data = pres_details.get("presentation", {})
-        groups = presentation_data.get("groups", [])
-        current_index = 0
 
-        for group in groups:
-            slides = group.get("slides", [])
-            for slide in slides:
-                if current_index == slide_index:
-                    return slide.get("notes") or slide.get("notes_html") or ""
-                current_index += 1
+class SlideThumbnailMixin:
+    """Mixin for entities showing the thumbnail of a streamed slide reference.
 
-        return None
+    Subclasses set _coordinator_keys and parse their slide reference into
+    _parsed_uuid and _parsed_index once per coordinator update.
+    """
+
+    # Streaming data keys the entity's state depends on
+    _coordinator_keys: tuple[str, ...]
+    _parsed_uuid: str | None
+    _parsed_index: int | None
+
+    def _init_thumbnail(self, config_entry: ConfigEntry) -> None:
+        """Initialize the thumbnail quality and URL caching variables."""
+        # Thumbnail quality is 200-800 (higher = better quality)
+        self._quality: int = config_entry.options.get(
+            CONF_THUMBNAIL_QUALITY, DEFAULT_THUMBNAIL_QUALITY
+        )
+        self._thumb_url_template = (
+            f"http://{self.api.host}:{self.api.port}"
+            f"/v1/presentation/{{}}/thumbnail/{{}}?quality={self._quality}"
+        )
+        self._last_image_url_ref: tuple[str, int] | None = None
+        self._last_image_url: str | None = None
+
+    def _slide_data_changed(self) -> bool:
+        """Return False for stream pushes that only changed unrelated data.
+
+        Timer and transport pushes are frequent and don't affect the slide.
+        """
+        return self.coordinator.is_dirty(*self._coordinator_keys)
+
+    @property
+    def image_url(self) -> str | None:
+        """Return the URL of the slide thumbnail."""
+        pres_uuid = self._parsed_uuid
+        slide_index = self._parsed_index
+
+        if pres_uuid is None or slide_index is None:
+            return None
+
+        # Rebuild the URL only when the slide reference changed
+        if self._last_image_url_ref != (pres_uuid, slide_index):
+            self._last_image_url_ref = (pres_uuid, slide_index)
+            self._last_image_url = self._thumb_url_template.format(
+                pres_uuid, slide_index
+            )
+        return self._last_image_url
 
 
 class ProPresenterPresentationThumbnail(
-    SlideNotesMixin, ProPresenterBaseEntity, ImageEntity
+    SlideThumbnailMixin, SlideNotesMixin, ProPresenterBaseEntity, ImageEntity
 ):
     """Image entity showing the current presentation slide thumbnail."""
 
     _attr_name = "Presentation Current Slide"
     _attr_icon = "mdi:presentation"
+    _coordinator_keys = ("status_layers", "slide_index")
 
     def __init__(
         self,
@@ -136,18 +455,22 @@ class ProPresenterPresentationThumbnail(
         )
         ImageEntity.__init__(self, hass)
         self.api = coordinator.api
+        self._init_thumbnail(config_entry)
         self._attr_unique_id = f"{config_entry.entry_id}_presentation_thumbnail"
         self._cached_image: bytes | None = None
-        self._black_image: bytes | None = None  # Cache the black image
         self._current_pres_uuid: str | None = None
         self._current_slide_index: int | None = None
-        self._current_slide_label: str | None = None
         self._image_last_updated: datetime | None = None
         self._slide_layer_active: bool = True  # Track slide layer status
         # Cache presentation info to preserve when layer is off
         self._cached_presentation_name: str | None = None
         self._cached_presentation_uuid: str | None = None
         self._cached_slide_index: int | None = None
+        # Slide reference parsed once per coordinator update
+        self._parsed_uuid: str | None = None
+        self._parsed_index: int | None = None
+        self._parsed_name: str | None = None
+        self._update_slide_ref()
         # Initialize notes caching from mixin
         self._init_notes_cache()
 
@@ -156,8 +479,25 @@ class ProPresenterPresentationThumbnail(
         """Return when the image was last updated."""
         return self._image_last_updated
 
+    def _update_slide_ref(self) -> bool:
+        """Parse the current slide reference for image_url/async_image.
+
+        Returns False if the stream has no presentation index info.
+        """
+        slide_ref = _parse_slide_ref(
+            self.coordinator.data, "slide_index", "presentation_index"
+        )
+        if not slide_ref:
+            self._parsed_uuid = self._parsed_index = self._parsed_name = None
+            return False
+        self._parsed_uuid, self._parsed_index, self._parsed_name = slide_ref
+        return True
+
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self._slide_data_changed():
+            return
+
         # Check if slide layer status changed
         status_layers = self.coordinator.data.get("status_layers", {})
         slide_layer_active = status_layers.get("slide", False)
@@ -166,53 +506,37 @@ class ProPresenterPresentationThumbnail(
             self._slide_layer_active = slide_layer_active
             # Update timestamp to force frontend refresh
             self._image_last_updated = dt_util.utcnow()
-            self.async_write_ha_state()
 
         # Check if slide changed and trigger update
-        slide_index_data = self.coordinator.data.get("slide_index")
-        if slide_index_data:
-            presentation_index_info = slide_index_data.get("presentation_index")
-            if presentation_index_info:
-                pres_uuid = get_nested_value(
-                    presentation_index_info, "presentation_id", "uuid"
-                )
-                slide_index = presentation_index_info.get("index")
-                pres_name = get_nested_value(
-                    presentation_index_info,
-                    "presentation_id",
-                    "name",
-                    default="Unknown",
-                )
-
-                # Cache presentation info for attributes (preserve even when layer is off)
-                self._cached_presentation_name = pres_name
-                self._cached_presentation_uuid = pres_uuid
-                self._cached_slide_index = slide_index
-
-                # If slide changed, clear cache to force refresh
-                if (
-                    pres_uuid != self._current_pres_uuid
-                    or slide_index != self._current_slide_index
-                ):
-                    # Update current slide tracking (so we know what's displayed)
-                    self._current_pres_uuid = pres_uuid
-                    self._current_slide_index = slide_index
-
-                    # Update timestamp so frontend will refetch the image
-                    # Use HA's timezone-aware now() function
-                    self._image_last_updated = dt_util.utcnow()
+        if self._update_slide_ref():
+            pres_uuid = self._parsed_uuid
+            slide_index = self._parsed_index
+            # Cache presentation info for attributes (preserve even when layer is off)
+            self._cached_presentation_name = self._parsed_name
+            self._cached_presentation_uuid = pres_uuid
+            self._cached_slide_index = slide_index
+
+            # If slide changed, clear cache to force refresh
+            if (
+                pres_uuid != self._current_pres_uuid
+                or slide_index != self._current_slide_index
+            ):
+                # Update current slide tracking (so we know what's displayed)
+                self._current_pres_uuid = pres_uuid
+                self._current_slide_index = slide_index
 
-                    # Clear image cache to force fetch on next image request
-                    self._cached_image = None
+                # Update timestamp so frontend will refetch the image
+                # Use HA's timezone-aware now() function
+                self._image_last_updated = dt_util.utcnow()
 
-                    # Fetch slide notes asynchronously
-                    if pres_uuid and slide_index is not None:
-                        self.hass.async_create_task(
-                            self._async_fetch_slide_notes(pres_uuid, slide_index)
-                        )
+                # Clear image cache to force fetch on next image request
+                self._cached_image = None
 
-                    self.async_write_ha_state()
+                # Update slide notes, fetching them if the presentation changed
+                if pres_uuid and slide_index is not None:
+                    self._update_slide_notes(pres_uuid, slide_index)
 
+        # Writes state once for everything changed above
         super()._handle_coordinator_update()
 
     @property
@@ -231,26 +555,6 @@ class ProPresenterPresentationThumbnail(
 
         return attributes
 
-    @property
-    def image_url(self) -> str | None:
-        """Return the URL of the current slide thumbnail."""
-        slide_index_data = self.coordinator.data.get("slide_index")
-        if not slide_index_data:
-            return None
-
-        presentation_index_info = slide_index_data.get("presentation_index")
-        if not presentation_index_info:
-            return None
-
-        pres_uuid = get_nested_value(presentation_index_info, "presentation_id", "uuid")
-        slide_index = presentation_index_info.get("index")
-
-        if pres_uuid is None or slide_index is None:
-            return None
-
-        # Build thumbnail URL with quality parameter (200-800, higher = better quality)
-        return f"http://{self.api.host}:{self.api.port}/v1/presentation/{pres_uuid}/thumbnail/{slide_index}?quality=800"
-
     async def async_image(self) -> bytes | None:
         """Return the image of the current slide, or black image if slide layer is cleared."""
         # Check if slide layer is active from streaming coordinator
@@ -259,21 +563,11 @@ class ProPresenterPresentationThumbnail(
 
         # If slide layer is cleared/off, return black image
         if not slide_layer_active:
-            # Create black image if not cached (will match thumbnail size)
-            if not self._black_image:
-                self._black_image = create_black_image(1920, 1080)  # Standard HD size
-            return self._black_image
-
-        slide_index_data = self.coordinator.data.get("slide_index")
-        if not slide_index_data:
-            return self._cached_image
+            # Shared black image (matches thumbnail size)
+            return _BLACK_JPEG_1080P
 
-        presentation_index_info = slide_index_data.get("presentation_index")
-        if not presentation_index_info:
-            return self._cached_image
-
-        pres_uuid = get_nested_value(presentation_index_info, "presentation_id", "uuid")
-        slide_index = presentation_index_info.get("index")
+        pres_uuid = self._parsed_uuid
+        slide_index = self._parsed_index
 
         if pres_uuid is None or slide_index is None:
             return self._cached_image
@@ -288,8 +582,8 @@ class ProPresenterPresentationThumbnail(
 
         # Fetch new thumbnail
         try:
-            thumbnail_data = await self.api.get_presentation_thumbnail(
-                pres_uuid, slide_index, quality=800
+            thumbnail_data = await _async_get_thumbnail(
+                self.api, pres_uuid, slide_index, quality=self._quality
             )
             if thumbnail_data:
                 self._cached_image = thumbnail_data
@@ -302,10 +596,12 @@ class ProPresenterPresentationThumbnail(
 
 
 class ProPresenterPresentationSlideThumbnailBase(
-    SlideNotesMixin, ProPresenterBaseEntity, ImageEntity
+    SlideThumbnailMixin, SlideNotesMixin, ProPresenterBaseEntity, ImageEntity
 ):
     """Base class for next/previous slide thumbnails."""
 
+    _coordinator_keys = ("slide_index",)
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -322,6 +618,7 @@ class ProPresenterPresentationSlideThumbnailBase(
         )
         ImageEntity.__init__(self, hass)
         self.api = coordinator.api
+        self._init_thumbnail(config_entry)
         self._attr_unique_id = f"{config_entry.entry_id}_{unique_id_suffix}"
         self._cached_image: bytes | None = None
         self._current_pres_uuid: str | None = None
@@ -329,6 +626,10 @@ class ProPresenterPresentationSlideThumbnailBase(
         self._image_last_updated: datetime | None = None
         self._slide_offset = slide_offset
         self._name_type = name_type
+        # Target slide reference parsed once per coordinator update
+        self._parsed_uuid: str | None = None
+        self._parsed_index: int | None = None
+        self._update_slide_ref()
         # Initialize notes caching from mixin
         self._init_notes_cache()
 
@@ -344,35 +645,44 @@ class ProPresenterPresentationSlideThumbnailBase(
         target_index = current_index + self._slide_offset
         return target_index if target_index >= 0 else None
 
+    def _update_slide_ref(self) -> bool:
+        """Parse the target slide reference for image_url/async_image.
+
+        Returns False if the stream has no presentation index info.
+        """
+        slide_ref = _parse_slide_ref(
+            self.coordinator.data, "slide_index", "presentation_index"
+        )
+        if not slide_ref:
+            self._parsed_uuid = self._parsed_index = None
+            return False
+        self._parsed_uuid = slide_ref[0]
+        self._parsed_index = self._calculate_target_index(slide_ref[1])
+        return True
+
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        slide_index_data = self.coordinator.data.get("slide_index")
-        if slide_index_data:
-            presentation_index_info = slide_index_data.get("presentation_index")
-            if presentation_index_info:
-                pres_uuid = get_nested_value(
-                    presentation_index_info, "presentation_id", "uuid"
-                )
-                slide_index = presentation_index_info.get("index")
-                target_index = self._calculate_target_index(slide_index)
-
-                if (
-                    pres_uuid != self._current_pres_uuid
-                    or target_index != self._current_slide_index
-                ):
-                    self._current_pres_uuid = pres_uuid
-                    self._current_slide_index = target_index
-                    self._image_last_updated = dt_util.utcnow()
-                    self._cached_image = None
-
-                    # Fetch slide notes asynchronously
-                    if pres_uuid and target_index is not None:
-                        self.hass.async_create_task(
-                            self._async_fetch_slide_notes(pres_uuid, target_index)
-                        )
-
-                    self.async_write_ha_state()
+        if not self._slide_data_changed():
+            return
+
+        if self._update_slide_ref():
+            pres_uuid = self._parsed_uuid
+            target_index = self._parsed_index
+
+            if (
+                pres_uuid != self._current_pres_uuid
+                or target_index != self._current_slide_index
+            ):
+                self._current_pres_uuid = pres_uuid
+                self._current_slide_index = target_index
+                self._image_last_updated = dt_util.utcnow()
+                self._cached_image = None
 
+                # Update slide notes, fetching them if the presentation changed
+                if pres_uuid and target_index is not None:
+                    self._update_slide_notes(pres_uuid, target_index)
+
+        # Writes state once for everything changed above
         super()._handle_coordinator_update()
 
     @property
@@ -386,39 +696,10 @@ class ProPresenterPresentationSlideThumbnailBase(
 
         return attributes
 
-    @property
-    def image_url(self) -> str | None:
-        """Return the URL of the target slide thumbnail."""
-        slide_index_data = self.coordinator.data.get("slide_index")
-        if not slide_index_data:
-            return None
-
-        presentation_index_info = slide_index_data.get("presentation_index")
-        if not presentation_index_info:
-            return None
-
-        pres_uuid = get_nested_value(presentation_index_info, "presentation_id", "uuid")
-        slide_index = presentation_index_info.get("index")
-        target_index = self._calculate_target_index(slide_index)
-
-        if pres_uuid is None or target_index is None:
-            return None
-
-        return f"http://{self.api.host}:{self.api.port}/v1/presentation/{pres_uuid}/thumbnail/{target_index}?quality=800"
-
     async def async_image(self) -> bytes | None:
         """Return the image of the target slide."""
-        slide_index_data = self.coordinator.data.get("slide_index")
-        if not slide_index_data:
-            return self._cached_image
-
-        presentation_index_info = slide_index_data.get("presentation_index")
-        if not presentation_index_info:
-            return self._cached_image
-
-        pres_uuid = get_nested_value(presentation_index_info, "presentation_id", "uuid")
-        slide_index = presentation_index_info.get("index")
-        target_index = self._calculate_target_index(slide_index)
+        pres_uuid = self._parsed_uuid
+        target_index = self._parsed_index
 
         if pres_uuid is None or target_index is None:
             return self._cached_image
@@ -431,8 +712,8 @@ class ProPresenterPresentationSlideThumbnailBase(
             return self._cached_image
 
         try:
-            thumbnail_data = await self.api.get_presentation_thumbnail(
-                pres_uuid, target_index, quality=800
+            thumbnail_data = await _async_get_thumbnail(
+                self.api, pres_uuid, target_index, quality=self._quality
             )
             if thumbnail_data:
                 self._cached_image = thumbnail_data
@@ -498,11 +779,14 @@ class ProPresenterPresentationPreviousSlideThumbnail(
         )
 
 
-class ProPresenterAnnouncementThumbnail(ProPresenterBaseEntity, ImageEntity):
+class ProPresenterAnnouncementThumbnail(
+    SlideThumbnailMixin, ProPresenterBaseEntity, ImageEntity
+):
     """Image entity showing the current announcement slide thumbnail."""
 
     _attr_name = "Announcement Thumbnail"
     _attr_icon = "mdi:bullhorn"
+    _coordinator_keys = ("announcement_slide_index",)
 
     def __init__(
         self,
@@ -517,81 +801,69 @@ class ProPresenterAnnouncementThumbnail(ProPresenterBaseEntity, ImageEntity):
         )
         ImageEntity.__init__(self, hass)
         self.api = coordinator.api
+        self._init_thumbnail(config_entry)
         self._attr_unique_id = f"{config_entry.entry_id}_announcement_thumbnail"
         self._cached_image: bytes | None = None
         self._current_pres_uuid: str | None = None
         self._current_slide_index: int | None = None
-        self._current_slide_label: str | None = None
         self._image_last_updated: datetime | None = None
+        # Slide reference parsed once per coordinator update
+        self._parsed_uuid: str | None = None
+        self._parsed_index: int | None = None
+        self._update_slide_ref()
 
     @property
     def image_last_updated(self) -> datetime | None:
         """Return when the image was last updated."""
         return self._image_last_updated
 
+    def _update_slide_ref(self) -> bool:
+        """Parse the announcement slide reference for image_url/async_image.
+
+        Returns False if the stream has no announcement index info.
+        """
+        slide_ref = _parse_slide_ref(
+            self.coordinator.data, "announcement_slide_index", "announcement_index"
+        )
+        if not slide_ref:
+            self._parsed_uuid = self._parsed_index = None
+            return False
+        self._parsed_uuid, self._parsed_index, _ = slide_ref
+        return True
+
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        # Check if slide changed and trigger update
-        slide_index_data = self.coordinator.data.get("announcement_slide_index")
-        if slide_index_data:
-            announcement_index_info = slide_index_data.get("announcement_index")
-            if announcement_index_info:
-                pres_uuid = get_nested_value(
-                    announcement_index_info, "presentation_id", "uuid"
-                )
-                slide_index = announcement_index_info.get("index")
+        if not self._slide_data_changed():
+            return
 
-                # If slide changed, clear cache to force refresh
-                if (
-                    pres_uuid != self._current_pres_uuid
-                    or slide_index != self._current_slide_index
-                ):
-                    # Update current slide tracking (so we know what's displayed)
-                    self._current_pres_uuid = pres_uuid
-                    self._current_slide_index = slide_index
+        # Check if slide changed and trigger update
+        if self._update_slide_ref():
+            pres_uuid = self._parsed_uuid
+            slide_index = self._parsed_index
+
+            # If slide changed, clear cache to force refresh
+            if (
+                pres_uuid != self._current_pres_uuid
+                or slide_index != self._current_slide_index
+            ):
+                # Update current slide tracking (so we know what's displayed)
+                self._current_pres_uuid = pres_uuid
+                self._current_slide_index = slide_index
 
-                    # Update timestamp so frontend will refetch the image
-                    # Use HA's timezone-aware now() function
-                    self._image_last_updated = dt_util.utcnow()
+                # Update timestamp so frontend will refetch the image
+                # Use HA's timezone-aware now() function
+                self._image_last_updated = dt_util.utcnow()
 
-                    # Clear image cache to force fetch on next image request
-                    self._cached_image = None
-                    self.async_write_ha_state()
+                # Clear image cache to force fetch on next image request
+                self._cached_image = None
 
+        # Writes state once for everything changed above
         super()._handle_coordinator_update()
 
-    @property
-    def image_url(self) -> str | None:
-        """Return the URL of the current announcement slide thumbnail."""
-        slide_index_data = self.coordinator.data.get("announcement_slide_index")
-        if not slide_index_data:
-            return None
-
-        announcement_index_info = slide_index_data.get("announcement_index")
-        if not announcement_index_info:
-            return None
-
-        pres_uuid = get_nested_value(announcement_index_info, "presentation_id", "uuid")
-        slide_index = announcement_index_info.get("index")
-
-        if pres_uuid is None or slide_index is None:
-            return None
-
-        # Build thumbnail URL with quality parameter
-        return f"http://{self.api.host}:{self.api.port}/v1/presentation/{pres_uuid}/thumbnail/{slide_index}?quality=800"
-
     async def async_image(self) -> bytes | None:
         """Return the image of the current announcement slide."""
-        slide_index_data = self.coordinator.data.get("announcement_slide_index")
-        if not slide_index_data:
-            return self._cached_image
-
-        announcement_index_info = slide_index_data.get("announcement_index")
-        if not announcement_index_info:
-            return self._cached_image
-
-        pres_uuid = get_nested_value(announcement_index_info, "presentation_id", "uuid")
-        slide_index = announcement_index_info.get("index")
+        pres_uuid = self._parsed_uuid
+        slide_index = self._parsed_index
 
         if pres_uuid is None or slide_index is None:
             return self._cached_image
@@ -606,8 +878,8 @@ class ProPresenterAnnouncementThumbnail(ProPresenterBaseEntity, ImageEntity):
 
         # Fetch new thumbnail
         try:
-            thumbnail_data = await self.api.get_presentation_thumbnail(
-                pres_uuid, slide_index, quality=800
+            thumbnail_data = await _async_get_thumbnail(
+                self.api, pres_uuid, slide_index, quality=self._quality
             )
             if thumbnail_data:
                 self._cached_image = thumbnail_data
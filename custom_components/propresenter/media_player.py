@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from abc import abstractmethod
+from collections import Counter, OrderedDict
 from datetime import datetime
+from functools import lru_cache
 import logging
+from types import MappingProxyType
+from typing import Any
 
 from homeassistant.components.media_player import (
     MediaPlayerEntity,
@@ -16,12 +21,25 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 import homeassistant.util.dt as dt_util
 
-from .base import ProPresenterBaseEntity
+from .base import ConditionalStateWriteMixin, ProPresenterBaseEntity
+from .const import CONF_THUMBNAIL_QUALITY, DEFAULT_THUMBNAIL_QUALITY
 from .coordinator import ProPresenterCoordinator, ProPresenterStreamingCoordinator
-from .utils import get_nested_value
+from .image import _async_get_thumbnail
+from .utils import PlaylistItemIndex
 
 _LOGGER = logging.getLogger(__name__)
 
+# Read-only stand-in for missing or empty streaming dicts
+_EMPTY: MappingProxyType[str, Any] = MappingProxyType({})
+
+# Recent media thumbnails kept per video player, so switching between a few
+# media items doesn't refetch them
+THUMBNAIL_CACHE_SIZE = 16
+
+# Seconds a playing position may drift from HA's extrapolation before it is
+# written again (positions are whole seconds, so allow for truncation)
+POSITION_DRIFT_TOLERANCE = 2
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -45,7 +63,79 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class ProPresenterMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
+def _int_or_none(value: Any) -> int | None:
+    """Return a transport number as an int, keeping a missing value as None."""
+    return int(value) if value is not None else None
+
+
+@lru_cache(maxsize=64)
+def _strip_extension(media_name: str) -> str:
+    """Return a media file name without its extension, for display."""
+    base, sep, _ext = media_name.rpartition(".")
+    return base if sep else media_name
+
+
+class TransportStateMixin(ConditionalStateWriteMixin):
+    """Mixin for media players whose state follows a streamed transport.
+
+    Snapshots must start with (state, media_position).
+    """
+
+    _position_updated_at: datetime | None = None
+    _props_version: int = -1
+    _cached_props: dict[str, Any]
+
+    @abstractmethod
+    def _compute_props(self) -> dict[str, Any]:
+        """Derive the transport properties from the streaming data."""
+
+    def _props(self) -> dict[str, Any]:
+        """Return the transport properties, derived once per streaming data change.
+
+        HA reads every property on each state write; this avoids walking the
+        transport dicts again for each of them.
+        """
+        version = self.streaming_coordinator.data_version
+        if version != self._props_version:
+            self._props_version = version
+            self._cached_props = self._compute_props()
+        return self._cached_props
+
+    def _write_transport_state(self) -> None:
+        """Write state if the transport changed, moving the position timestamp."""
+        snapshot = self._state_snapshot()
+        previous = self._last_written_snapshot
+        # HA extrapolates the position from when it was last updated, so only
+        # move that timestamp when the playback state or position changed
+        if previous is None or snapshot[:2] != previous[:2]:
+            if (
+                previous is not None
+                and snapshot[2:] == previous[2:]
+                and self._position_extrapolates(snapshot, previous)
+            ):
+                # Only the position moved, and by as much as HA assumes
+                return
+            self._position_updated_at = dt_util.utcnow()
+        self._write_state_if_changed(snapshot)
+
+    def _position_extrapolates(self, snapshot: tuple, previous: tuple) -> bool:
+        """Return True if playback advanced the position as HA extrapolates it."""
+        state, position = snapshot[:2]
+        if (
+            state != MediaPlayerState.PLAYING
+            or previous[0] != state
+            or position is None
+            or previous[1] is None
+            or self._position_updated_at is None
+        ):
+            return False
+        elapsed = (dt_util.utcnow() - self._position_updated_at).total_seconds()
+        return abs(previous[1] + elapsed - position) < POSITION_DRIFT_TOLERANCE
+
+
+class ProPresenterMediaPlayer(
+    TransportStateMixin, ProPresenterBaseEntity, MediaPlayerEntity
+):
     """Media player entity for ProPresenter audio control."""
 
     _attr_name = "Audio Player"
@@ -71,11 +161,12 @@ class ProPresenterMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
         super().__init__(coordinator, config_entry)
         self.streaming_coordinator = streaming_coordinator
         self._attr_unique_id = f"{config_entry.entry_id}_audio_player"
-        self._position_updated_at: datetime | None = None
         self._last_selected_source = None  # Remember last selected audio track
         self._previous_active_source = (
             None  # Track previous active track to detect PP changes
         )
+        # Last unknown track a playlist refresh was requested for
+        self._refreshed_unknown_track: str | None = None
 
         # Subscribe to streaming coordinator updates
         self.async_on_remove(
@@ -93,74 +184,75 @@ class ProPresenterMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
             self._last_selected_source = current_active_source
 
         self._previous_active_source = current_active_source
-        super()._handle_coordinator_update()
+        # Playlist polls rarely change anything shown, so only write on change
+        self._write_transport_state()
 
     def _handle_streaming_coordinator_update(self) -> None:
         """Handle updated data from the streaming coordinator (fast audio transport updates)."""
-        # Update the timestamp when streaming coordinator provides new data
-        self._position_updated_at = dt_util.utcnow()
-
         # Check if an unknown audio track is playing and clear cache if needed
-        audio_transport_state = self.streaming_coordinator.data.get(
-            "audio_transport_state", {}
+        data = self.streaming_coordinator.data
+        media_name = (data.get("audio_transport_state") or _EMPTY).get("name")
+
+        # If audio is playing but not in our cache, clear the cache to refresh.
+        # Only once per track: every streaming push until the refresh lands
+        # (or forever, for audio outside any playlist) would otherwise queue
+        # another refresh.
+        if (
+            media_name
+            and media_name != self._refreshed_unknown_track
+            and media_name not in self._track_index().names
+        ):
+            self._refreshed_unknown_track = media_name
+            self.coordinator.invalidate_playlist_cache()
+            # Trigger a coordinator refresh to reload audio playlists
+            self.hass.async_create_task(self.coordinator.async_request_refresh())
+
+        self._write_transport_state()
+
+    def _state_snapshot(self) -> tuple:
+        """Return the values that make up this entity's visible state."""
+        return (
+            self.state,
+            self.media_position,
+            self.media_title,
+            self.media_duration,
+            self.source,
+            # Same list object until the playlists are refetched
+            self.source_list,
+            self.available,
         )
-        media_name = audio_transport_state.get("name")
-
-        if media_name:
-            # Check if this audio track exists in our cached audio list
-            audio_playlist_details_list = self.coordinator.data.get(
-                "audio_playlist_details_list", []
-            )
-            track_found = False
-
-            for playlist_details in audio_playlist_details_list:
-                items = playlist_details.get("items", [])
-                for item in items:
-                    if item.get("type") == "audio":
-                        track_name = get_nested_value(item, "id", "name", default="")
-                        if track_name == media_name:
-                            track_found = True
-                            break
-                if track_found:
-                    break
-
-            # If audio is playing but not in our cache, clear the cache to refresh
-            if not track_found:
-                self.coordinator.invalidate_playlist_cache()
-                # Trigger a coordinator refresh to reload audio playlists
-                self.hass.async_create_task(self.coordinator.async_request_refresh())
-
-        # Only write state if entity is added to hass
-        if self.hass is not None:
-            self.async_write_ha_state()
 
-    @property
-    def state(self) -> MediaPlayerState:
-        """Return the state of the player."""
-        # Check audio transport state for actual playback status (from streaming coordinator)
-        audio_transport_state = self.streaming_coordinator.data.get(
-            "audio_transport_state", {}
-        )
+    def _compute_props(self) -> dict[str, Any]:
+        """Derive the transport properties from the streaming data."""
+        data = self.streaming_coordinator.data
+        # The field is "name" not "media_name"
+        audio_transport_state = data.get("audio_transport_state") or _EMPTY
+        media_name = audio_transport_state.get("name")
 
-        # If there's no transport state data, return OFF (layer is cleared)
+        # If there's no transport state data, the layer is cleared
         if not audio_transport_state:
-            return MediaPlayerState.OFF
-
+            state = MediaPlayerState.OFF
         # Check if currently playing (field is "is_playing" not "isplaying")
-        is_playing = audio_transport_state.get("is_playing", False)
-
-        if is_playing:
-            return MediaPlayerState.PLAYING
+        elif audio_transport_state.get("is_playing", False):
+            state = MediaPlayerState.PLAYING
+        # If not playing but has media loaded, it's paused
+        elif media_name or audio_transport_state.get("uuid"):
+            state = MediaPlayerState.PAUSED
+        # No media loaded = OFF
+        else:
+            state = MediaPlayerState.OFF
 
-        # If not playing but has media loaded, return PAUSED
-        has_media = audio_transport_state.get("name") or audio_transport_state.get(
-            "uuid"
-        )
-        if has_media:
-            return MediaPlayerState.PAUSED
+        return {
+            "state": state,
+            "media_title": _strip_extension(media_name) if media_name else None,
+            "media_duration": _int_or_none(audio_transport_state.get("duration")),
+            "media_position": _int_or_none(data.get("audio_transport_time")),
+        }
 
-        # No media loaded = OFF
-        return MediaPlayerState.OFF
+    @property
+    def state(self) -> MediaPlayerState:
+        """Return the state of the player."""
+        return self._props()["state"]
 
     @property
     def media_content_type(self) -> str:
@@ -170,91 +262,32 @@ class ProPresenterMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
     @property
     def media_title(self) -> str | None:
         """Title of current playing media."""
-        # Get the current track name from transport state (from streaming coordinator)
-        audio_transport_state = self.streaming_coordinator.data.get(
-            "audio_transport_state", {}
-        )
-
-        # The field is "name" not "media_name"
-        media_name = audio_transport_state.get("name")
-
-        if media_name:
-            # Remove file extension if present
-            if "." in media_name:
-                media_name = media_name.rsplit(".", 1)[0]
-            return media_name
-
-        return None
+        return self._props()["media_title"]
 
     @property
     def media_duration(self) -> int | None:
         """Duration of current playing media in seconds."""
-        audio_transport_state = self.streaming_coordinator.data.get(
-            "audio_transport_state", {}
-        )
-        duration = audio_transport_state.get("duration")
-
-        if duration is not None:
-            return int(duration)
-        return None
+        return self._props()["media_duration"]
 
     @property
     def media_position(self) -> int | None:
         """Position of current playing media in seconds."""
-        audio_transport_time = self.streaming_coordinator.data.get(
-            "audio_transport_time"
-        )
-
-        if audio_transport_time is not None:
-            return int(audio_transport_time)
-        return None
+        return self._props()["media_position"]
 
     @property
     def media_position_updated_at(self) -> datetime | None:
         """When was the position last updated."""
         return self._position_updated_at
 
+    def _track_index(self) -> PlaylistItemIndex:
+        """Return the index of audio tracks from all playlists."""
+        return self.coordinator.playlist_item_index("audio_playlist_details_list")
+
     @property
     def source_list(self) -> list[str] | None:
         """List of available audio tracks from all playlists."""
-        audio_playlist_details_list = self.coordinator.data.get(
-            "audio_playlist_details_list", []
-        )
-
-        if not audio_playlist_details_list:
-            return None
-
-        track_list = []
-
-        # Iterate through all playlists
-        for playlist_details in audio_playlist_details_list:
-            playlist_name = get_nested_value(
-                playlist_details, "id", "name", default="Unknown Playlist"
-            )
-            items = playlist_details.get("items", [])
-
-            if not items:
-                continue
-
-            # Add tracks from this playlist
-            for item in items:
-                if item.get("type") == "audio":
-                    track_name = get_nested_value(
-                        item, "id", "name", default="Unknown Track"
-                    )
-                    # Remove .mp3 extension if present for cleaner display
-                    if track_name.endswith(".mp3"):
-                        track_name = track_name[:-4]
-
-                    # Format as "Playlist Name - Track Name" if multiple playlists
-                    if len(audio_playlist_details_list) > 1:
-                        display_name = f"{playlist_name} - {track_name}"
-                    else:
-                        display_name = track_name
-
-                    track_list.append(display_name)
-
-        return track_list if track_list else None
+        # Formatted as "Playlist Name - Track Name" if multiple playlists
+        return self._track_index().display_names or None
 
     @property
     def source(self) -> str | None:
@@ -292,68 +325,23 @@ class ProPresenterMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
 
     async def async_select_source(self, source: str) -> None:
         """Select audio track to play."""
-
-        audio_playlist_details_list = self.coordinator.data.get(
-            "audio_playlist_details_list", []
-        )
-
-        if not audio_playlist_details_list:
+        if not self.coordinator.data.get("audio_playlist_details_list"):
             _LOGGER.error("No audio playlist data available")
             return
 
-        # Search through all playlists to find the track
-        playlist_uuid = None
-        track_uuid = None
-        found = False
-
-        for playlist_details in audio_playlist_details_list:
-            current_playlist_uuid = get_nested_value(playlist_details, "id", "uuid")
-            playlist_name = get_nested_value(
-                playlist_details, "id", "name", default="Unknown Playlist"
-            )
-            items = playlist_details.get("items", [])
-
-            for item in items:
-                if item.get("type") == "audio":
-                    track_name = get_nested_value(item, "id", "name", default="")
-                    # Remove .mp3 extension for comparison
-                    display_track_name = (
-                        track_name[:-4] if track_name.endswith(".mp3") else track_name
-                    )
-
-                    # Check if this is the selected track
-                    # Handle both "Playlist - Track" and "Track" formats
-                    if len(audio_playlist_details_list) > 1:
-                        full_display_name = f"{playlist_name} - {display_track_name}"
-                        if full_display_name == source:
-                            playlist_uuid = current_playlist_uuid
-                            track_uuid = get_nested_value(item, "id", "uuid")
-                            found = True
-                            break
-                    else:
-                        if display_track_name == source or track_name == source:
-                            playlist_uuid = current_playlist_uuid
-                            track_uuid = get_nested_value(item, "id", "uuid")
-                            found = True
-                            break
-
-            if found:
-                break
-
-        if not playlist_uuid or not track_uuid:
-            _LOGGER.error(f"Could not find track: {source}")
+        # Handles both "Playlist - Track" and "Track" formats
+        track = self._track_index().items.get(source)
+        if not track:
+            _LOGGER.error("Could not find track: %s", source)
             return
 
+        playlist_uuid, track_uuid = track
         await self.coordinator.api.trigger_audio_track(playlist_uuid, track_uuid)
 
     async def async_turn_on(self) -> None:
         """Turn on - resume if paused."""
-        # If already playing, do nothing
-        if self.state == MediaPlayerState.PLAYING:
-            return
-
-        # If paused, just resume
-        if self.state == MediaPlayerState.PAUSED:
+        # If paused, just resume (nothing to do if already playing)
+        if self.state is MediaPlayerState.PAUSED:
             await self.async_media_play()
 
     async def async_turn_off(self) -> None:
@@ -368,11 +356,28 @@ class ProPresenterMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
         await self.coordinator.api.trigger_clear_layer("audio")
 
 
-class ProPresenterVideoMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
+# Video player features for all media, and with playback controls for video
+_MEDIA_BASE_FEATURES = (
+    MediaPlayerEntityFeature.SELECT_SOURCE
+    | MediaPlayerEntityFeature.TURN_ON
+    | MediaPlayerEntityFeature.TURN_OFF
+)
+_VIDEO_FEATURES = (
+    _MEDIA_BASE_FEATURES
+    | MediaPlayerEntityFeature.PLAY
+    | MediaPlayerEntityFeature.PAUSE
+    | MediaPlayerEntityFeature.SEEK
+)
+
+
+class ProPresenterVideoMediaPlayer(
+    TransportStateMixin, ProPresenterBaseEntity, MediaPlayerEntity
+):
     """Media player entity for ProPresenter video/media control."""
 
     _attr_name = "Media Player"
     _attr_icon = "mdi:image-area"
+    _attr_supported_features = _VIDEO_FEATURES
 
     def __init__(
         self,
@@ -384,9 +389,9 @@ class ProPresenterVideoMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
         super().__init__(coordinator, config_entry)
         self.streaming_coordinator = streaming_coordinator
         self._attr_unique_id = f"{config_entry.entry_id}_video_player"
-        self._position_updated_at: datetime | None = None
-        self._cached_thumbnail: bytes | None = None
-        self._cached_thumbnail_uuid: str | None = None
+        # LRU of media thumbnails keyed on media UUID
+        self._thumbnail_cache: OrderedDict[str, bytes] = OrderedDict()
+        self._thumbnail_cache_source: Any = None  # Media playlists last pruned for
         self._last_selected_source = None  # Remember last selected media
         self._previous_active_source = (
             None  # Track previous active media to detect PP changes
@@ -398,6 +403,7 @@ class ProPresenterVideoMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
         self._previous_media_layer_state: bool | None = (
             None  # Track if media layer was active in previous update (None = first run)
         )
+        self._update_supported_features()
 
         # Subscribe to streaming coordinator updates
         self.async_on_remove(
@@ -406,33 +412,18 @@ class ProPresenterVideoMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
             )
         )
 
-    @property
-    def supported_features(self) -> MediaPlayerEntityFeature:
-        """Flag media player features that are supported."""
-        # Get current media type
-        active_media = self.streaming_coordinator.data.get("active_media_playlist", {})
-        item = active_media.get("item") if active_media else None
-        media_type = item.get("type", "video") if item else "video"
-
-        # Base features for all media
-        features = (
-            MediaPlayerEntityFeature.SELECT_SOURCE
-            | MediaPlayerEntityFeature.TURN_ON
-            | MediaPlayerEntityFeature.TURN_OFF
-        )
-
-        # Add playback controls only for video (not for images)
-        if media_type == "video":
-            features |= (
-                MediaPlayerEntityFeature.PLAY
-                | MediaPlayerEntityFeature.PAUSE
-                | MediaPlayerEntityFeature.SEEK
-            )
-
-        return features
+    def _update_supported_features(self) -> None:
+        """Update supported features for the current media type."""
+        # Playback controls only for video (not for images)
+        if self._props()["media_type"] == "video":
+            self._attr_supported_features = _VIDEO_FEATURES
+        else:
+            self._attr_supported_features = _MEDIA_BASE_FEATURES
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the main coordinator."""
+        self._prune_thumbnail_cache()
+
         # Always track the current active media (so we can restore it after turn_off)
         current_active_source = self.source
 
@@ -441,15 +432,25 @@ class ProPresenterVideoMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
             self._last_selected_source = current_active_source
 
         self._previous_active_source = current_active_source
-        super()._handle_coordinator_update()
+        # Playlist polls rarely change anything shown, so only write on change
+        self._write_transport_state()
 
     def _handle_streaming_coordinator_update(self) -> None:
         """Handle updated data from the streaming coordinator (streaming updates)."""
-        # Track Media Action originating slide
-        status_layers = self.streaming_coordinator.data.get("status_layers", {})
-        media_layer_active = status_layers.get("media", False)
-        active_media = self.streaming_coordinator.data.get("active_media_playlist", {})
-        item = active_media.get("item") if active_media else None
+        # The media layer and item only come from these keys; on other
+        # updates (e.g. transport time) the Media Action state is unchanged
+        if self.streaming_coordinator.is_dirty(
+            "status_layers", "active_media_playlist"
+        ):
+            self._update_media_action_state()
+            self._update_supported_features()
+        self._write_transport_state()
+
+    def _update_media_action_state(self) -> None:
+        """Track the slide that started a Media Action."""
+        data = self.streaming_coordinator.data
+        media_layer_active = (data.get("status_layers") or _EMPTY).get("media", False)
+        item = self._props()["item"]
 
         is_media_action_active = media_layer_active and not item
 
@@ -469,65 +470,77 @@ class ProPresenterVideoMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
         # Remember current media layer state for next update
         self._previous_media_layer_state = is_media_action_active
 
-        # Update the timestamp when streaming coordinator provides new data
-        self._position_updated_at = dt_util.utcnow()
-
-        # Only write state if entity is added to hass
-        if self.hass is not None:
-            self.async_write_ha_state()
+    def _state_snapshot(self) -> tuple:
+        """Return the values that make up this entity's visible state."""
+        return (
+            self.state,
+            self.media_position,
+            self.media_title,
+            self.media_duration,
+            self.source,
+            # Same list object until the playlists are refetched
+            self.source_list,
+            self.media_image_hash,
+            self.supported_features,
+            self.available,
+        )
 
-    @property
-    def state(self) -> MediaPlayerState:
-        """Return the state of the player."""
+    def _compute_props(self) -> dict[str, Any]:
+        """Derive the transport properties from the streaming data."""
+        data = self.streaming_coordinator.data
         # Check presentation transport state for actual playback status
-        transport_state = self.streaming_coordinator.data.get(
-            "presentation_transport_state", {}
-        )
+        transport_state = data.get("presentation_transport_state") or _EMPTY
+        # Keep the full filename with extension for display
+        name = transport_state.get("name", "") or None
 
-        # If there's no transport state data, return OFF (layer is cleared)
+        # If there's no transport state data, the layer is cleared
         if not transport_state:
-            return MediaPlayerState.OFF
-
-        # Check if currently playing
-        is_playing = transport_state.get("is_playing", False)
+            state = MediaPlayerState.OFF
+        elif transport_state.get("is_playing", False):
+            state = MediaPlayerState.PLAYING
+        # If not playing but has media loaded, it's paused
+        elif name or transport_state.get("uuid"):
+            state = MediaPlayerState.PAUSED
+        # No media loaded = OFF
+        else:
+            state = MediaPlayerState.OFF
 
-        if is_playing:
-            return MediaPlayerState.PLAYING
+        # Check if the current media is an image or video
+        item = (data.get("active_media_playlist") or _EMPTY).get("item")
+        media_type = item.get("type", "video") if item else "video"
 
-        # If not playing but has media loaded, return PAUSED
-        has_media = transport_state.get("name") or transport_state.get("uuid")
-        if has_media:
-            return MediaPlayerState.PAUSED
+        return {
+            "state": state,
+            "media_title": name,
+            "source": name,
+            "media_duration": _int_or_none(transport_state.get("duration")),
+            "media_position": _int_or_none(data.get("presentation_transport_time")),
+            "media_type": media_type,
+            "media_content_type": (
+                MediaType.IMAGE if media_type == "image" else MediaType.VIDEO
+            ),
+            "item": item,
+        }
 
-        # No media loaded = OFF
-        return MediaPlayerState.OFF
+    @property
+    def state(self) -> MediaPlayerState:
+        """Return the state of the player."""
+        return self._props()["state"]
 
     @property
     def media_title(self) -> str | None:
         """Return the title of current playing media."""
-        transport_state = self.streaming_coordinator.data.get(
-            "presentation_transport_state", {}
-        )
-        name = transport_state.get("name", "")
-        # Keep the full filename with extension for display
-        return name if name else None
+        return self._props()["media_title"]
 
     @property
     def media_duration(self) -> int | None:
         """Return the duration of current playing media in seconds."""
-        transport_state = self.streaming_coordinator.data.get(
-            "presentation_transport_state", {}
-        )
-        duration = transport_state.get("duration")
-        return int(duration) if duration else None
+        return self._props()["media_duration"]
 
     @property
     def media_position(self) -> int | None:
         """Return the current playback position in seconds."""
-        transport_time = self.streaming_coordinator.data.get(
-            "presentation_transport_time"
-        )
-        return int(transport_time) if transport_time is not None else None
+        return self._props()["media_position"]
 
     @property
     def media_position_updated_at(self) -> datetime | None:
@@ -537,14 +550,7 @@ class ProPresenterVideoMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
     @property
     def media_content_type(self) -> str:
         """Return the content type of current playing media."""
-        # Check if the current media is an image or video
-        active_media = self.streaming_coordinator.data.get("active_media_playlist", {})
-        item = active_media.get("item") if active_media else None
-        media_type = item.get("type", "video") if item else "video"
-
-        if media_type == "image":
-            return MediaType.IMAGE
-        return MediaType.VIDEO
+        return self._props()["media_content_type"]
 
     def _get_current_slide_info(self) -> tuple[str | None, int | None]:
         """Get current presentation UUID and slide index from coordinator data.
@@ -573,16 +579,15 @@ class ProPresenterVideoMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
             return None
 
         # Return the UUID as the hash - this tells HA when the image has changed
-        active_media = self.streaming_coordinator.data.get("active_media_playlist", {})
-        item = active_media.get("item") if active_media else None
+        item = self._props()["item"]
 
         if item:
             # Media from playlist - use media UUID
             return item.get("uuid")
 
         # Check if media is playing from a Media Action (slide tab)
-        status_layers = self.streaming_coordinator.data.get("status_layers", {})
-        media_layer_active = status_layers.get("media", False)
+        data = self.streaming_coordinator.data
+        media_layer_active = (data.get("status_layers") or _EMPTY).get("media", False)
 
         if media_layer_active:
             # Media from Media Action - use saved originating slide info
@@ -596,61 +601,18 @@ class ProPresenterVideoMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
     @property
     def source(self) -> str | None:
         """Return the current input source."""
-        transport_state = self.streaming_coordinator.data.get(
-            "presentation_transport_state", {}
-        )
-
-        if not transport_state:
-            return None
-
-        name = transport_state.get("name", "")
         # Keep the full filename with extension
-        return name if name else None
+        return self._props()["source"]
+
+    def _item_index(self) -> PlaylistItemIndex:
+        """Return the index of media items from all playlists."""
+        return self.coordinator.playlist_item_index("media_playlist_details_list")
 
     @property
     def source_list(self) -> list[str]:
         """Return the list of available media sources."""
-        media_playlist_details_list = self.coordinator.data.get(
-            "media_playlist_details_list", []
-        )
-
-        if not media_playlist_details_list:
-            return []
-
-        sources = []
-
-        for playlist_details in media_playlist_details_list:
-            if not playlist_details:
-                continue
-
-            playlist_id = playlist_details.get("id")
-            if not playlist_id:
-                continue
-
-            playlist_name = playlist_id.get("name", "Unknown Playlist")
-            items = playlist_details.get("items", [])
-
-            for item in items:
-                if not item:
-                    continue
-
-                item_id = item.get("id")
-                if not item_id:
-                    continue
-
-                item_name = item_id.get("name", "")
-                if not item_name:
-                    continue
-
-                # If we have multiple playlists, prefix with playlist name
-                if len(media_playlist_details_list) > 1:
-                    display_name = f"{playlist_name} - {item_name}"
-                else:
-                    display_name = item_name
-
-                sources.append(display_name)
-
-        return sources
+        # Prefixed with the playlist name if there are multiple playlists
+        return self._item_index().display_names
 
     async def async_media_play(self) -> None:
         """Send play command."""
@@ -664,19 +626,42 @@ class ProPresenterVideoMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
         """Send seek command."""
         await self.coordinator.api.presentation_seek(position)
 
+    def _prune_thumbnail_cache(self) -> None:
+        """Drop cached media thumbnails that are no longer in any media playlist."""
+        details_list = self.coordinator.data.get("media_playlist_details_list")
+        if details_list is self._thumbnail_cache_source:
+            return
+        self._thumbnail_cache_source = details_list
+
+        media_uuids = {item_uuid for _, item_uuid in self._item_index().items.values()}
+        for key in [key for key in self._thumbnail_cache if key not in media_uuids]:
+            del self._thumbnail_cache[key]
+
+    def _get_cached_thumbnail(self, key: str) -> bytes | None:
+        """Return a cached thumbnail, marking it as recently used."""
+        thumbnail_data = self._thumbnail_cache.get(key)
+        if thumbnail_data is not None:
+            self._thumbnail_cache.move_to_end(key)
+        return thumbnail_data
+
+    def _cache_thumbnail(self, key: str, thumbnail_data: bytes) -> None:
+        """Cache a thumbnail, evicting the least recently used if full."""
+        self._thumbnail_cache[key] = thumbnail_data
+        if len(self._thumbnail_cache) > THUMBNAIL_CACHE_SIZE:
+            self._thumbnail_cache.popitem(last=False)
+
     async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
         """Fetch media image of current playing media."""
         try:
             # Get the current media item UUID from the active playlist
-            active_media = self.streaming_coordinator.data.get(
-                "active_media_playlist", {}
-            )
-            item = active_media.get("item") if active_media else None
+            item = self._props()["item"]
             media_uuid = item.get("uuid") if item else None
 
             # Check if media is playing from a Media Action (media layer active but no playlist)
-            status_layers = self.streaming_coordinator.data.get("status_layers", {})
-            media_layer_active = status_layers.get("media", False)
+            data = self.streaming_coordinator.data
+            media_layer_active = (data.get("status_layers") or _EMPTY).get(
+                "media", False
+            )
 
             if media_layer_active and not media_uuid:
                 # Media is playing from a Media Action (slide tab), not from media playlist
@@ -688,25 +673,17 @@ class ProPresenterVideoMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
                 pres_uuid, slide_index = self._media_action_slide_info
 
                 if pres_uuid is not None and slide_index is not None:
-                    cache_key = f"{pres_uuid}_{slide_index}"
-
-                    # Check cache
-                    if (
-                        cache_key == self._cached_thumbnail_uuid
-                        and self._cached_thumbnail
-                    ):
-                        return self._cached_thumbnail, "image/jpeg"
-
-                    # Fetch slide thumbnail
-                    thumbnail_data = (
-                        await self.coordinator.api.get_presentation_thumbnail(
-                            pres_uuid, slide_index, quality=400
-                        )
+                    # Slide thumbnails are shared with the image entities
+                    thumbnail_data = await _async_get_thumbnail(
+                        self.coordinator.api,
+                        pres_uuid,
+                        slide_index,
+                        quality=self.config_entry.options.get(
+                            CONF_THUMBNAIL_QUALITY, DEFAULT_THUMBNAIL_QUALITY
+                        ),
                     )
 
                     if thumbnail_data:
-                        self._cached_thumbnail = thumbnail_data
-                        self._cached_thumbnail_uuid = cache_key
                         return thumbnail_data, "image/jpeg"
 
                 return None, None
@@ -715,8 +692,9 @@ class ProPresenterVideoMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
                 return None, None
 
             # Check if we already have this thumbnail cached
-            if media_uuid == self._cached_thumbnail_uuid and self._cached_thumbnail:
-                return self._cached_thumbnail, "image/jpeg"
+            thumbnail_data = self._get_cached_thumbnail(media_uuid)
+            if thumbnail_data:
+                return thumbnail_data, "image/jpeg"
 
             # Fetch new thumbnail
             thumbnail_data = await self.coordinator.api.get_media_thumbnail(
@@ -724,92 +702,35 @@ class ProPresenterVideoMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
             )
 
             if thumbnail_data:
-                self._cached_thumbnail = thumbnail_data
-                self._cached_thumbnail_uuid = media_uuid
+                self._cache_thumbnail(media_uuid, thumbnail_data)
                 return thumbnail_data, "image/jpeg"
             else:
-                _LOGGER.warning(f"No thumbnail data received for UUID: {media_uuid}")
+                _LOGGER.warning("No thumbnail data received for UUID: %s", media_uuid)
 
             return None, None
         except Exception as err:
-            _LOGGER.error(f"Error fetching media thumbnail: {err}", exc_info=True)
+            _LOGGER.error("Error fetching media thumbnail: %s", err, exc_info=True)
             return None, None
 
     async def async_select_source(self, source: str) -> None:
         """Select media source to play."""
-        media_playlist_details_list = self.coordinator.data.get(
-            "media_playlist_details_list", []
-        )
-
-        if not media_playlist_details_list:
+        if not self.coordinator.data.get("media_playlist_details_list"):
             _LOGGER.error("No media playlist data available")
             return
 
-        # Search through all playlists to find the item
-        playlist_uuid = None
-        item_uuid = None
-        found = False
-
-        for playlist_details in media_playlist_details_list:
-            if not playlist_details:
-                continue
-
-            playlist_id = playlist_details.get("id")
-            if not playlist_id:
-                continue
-
-            current_playlist_uuid = playlist_id.get("uuid")
-            playlist_name = playlist_id.get("name", "Unknown Playlist")
-            items = playlist_details.get("items", [])
-
-            for item in items:
-                if not item:
-                    continue
-
-                # Accept all items from media playlists (see note in source_list about Mac bug)
-                item_id = item.get("id")
-                if not item_id:
-                    continue
-
-                item_name = item_id.get("name", "")
-                item_item_uuid = item_id.get("uuid")
-
-                if not item_name or not item_item_uuid:
-                    continue
-
-                # Check if this is the selected item
-                # Handle both "Playlist - Item" and "Item" formats
-                if len(media_playlist_details_list) > 1:
-                    full_display_name = f"{playlist_name} - {item_name}"
-                    if full_display_name == source:
-                        playlist_uuid = current_playlist_uuid
-                        item_uuid = item_item_uuid
-                        found = True
-                        break
-                else:
-                    if item_name == source:
-                        playlist_uuid = current_playlist_uuid
-                        item_uuid = item_item_uuid
-                        found = True
-                        break
-
-            if found:
-                break
-
-        if not playlist_uuid or not item_uuid:
-            _LOGGER.error(f"Could not find media item: {source}")
+        # Handles both "Playlist - Item" and "Item" formats
+        media_item = self._item_index().items.get(source)
+        if not media_item:
+            _LOGGER.error("Could not find media item: %s", source)
             return
 
+        playlist_uuid, item_uuid = media_item
         await self.coordinator.api.trigger_media_item(playlist_uuid, item_uuid)
 
     async def async_turn_on(self) -> None:
         """Turn on - resume if paused."""
-        # If already playing, do nothing
-        if self.state == MediaPlayerState.PLAYING:
-            return
-
-        # If paused, just resume
-        if self.state == MediaPlayerState.PAUSED:
+        # If paused, just resume (nothing to do if already playing)
+        if self.state is MediaPlayerState.PAUSED:
             await self.async_media_play()
 
     async def async_turn_off(self) -> None:
@@ -823,7 +744,9 @@ class ProPresenterVideoMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
         await self.coordinator.api.trigger_clear_layer("media")
 
 
-class ProPresenterPropMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
+class ProPresenterPropMediaPlayer(
+    ConditionalStateWriteMixin, ProPresenterBaseEntity, MediaPlayerEntity
+):
     """Media player entity for ProPresenter props control."""
 
     _attr_name = "Props"
@@ -845,7 +768,12 @@ class ProPresenterPropMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
             streaming_coordinator, config_entry, static_coordinator=coordinator
         )
         self._attr_unique_id = f"{config_entry.entry_id}_prop_player"
-        self._prop_uuid_map = {}  # Map display names to UUIDs
+        self._prop_names: list[str] = []
+        self._prop_uuid_map: dict[str, str] = {}  # Map display names to UUIDs
+        self._prop_display_names: dict[str, str] = {}  # And UUIDs back to names
+        self._props_source: Any = None  # Props list the index was built from
+        self._any_prop_active = False
+        self._active_prop_uuid: str | None = None
         self._last_selected_prop = None  # Remember last selected prop for turn_on
         self._previous_active_prop = (
             None  # Track previous active prop to detect PP changes
@@ -861,93 +789,97 @@ class ProPresenterPropMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
             self._last_selected_prop = current_active_prop
 
         self._previous_active_prop = current_active_prop
-        super()._handle_coordinator_update()
+        # Props share the streaming coordinator with fast timer/transport
+        # pushes, so only write when the props actually changed
+        self._write_state_if_changed()
+
+    def _state_snapshot(self) -> tuple:
+        """Return the values that make up this entity's visible state."""
+        return (
+            # Same list object until the props are replaced
+            self.source_list,
+            self.state,
+            self.source,
+            self.media_image_url,
+            self.available,
+        )
 
     @property
     def state(self) -> MediaPlayerState:
         """Return the state of the player."""
-        props = self.coordinator.data.get("props", [])
-
-        # Check if any prop is active
-        for prop in props:
-            if prop.get("is_active", False):
-                return MediaPlayerState.ON
-
+        self._update_prop_index()
+        if self._any_prop_active:
+            return MediaPlayerState.ON
         return MediaPlayerState.OFF
 
-    @property
-    def source_list(self) -> list[str]:
-        """Return list of available props."""
-        props = self.coordinator.data.get("props", [])
+    def _update_prop_index(self) -> None:
+        """Re-index the props when the props list is replaced.
+
+        Builds the display names and finds the active prop in one pass, so
+        state, source and media_image_url don't each scan the props.
+        """
+        props = self.coordinator.data.get("props") or ()
+        if props is self._props_source:
+            return
+        self._props_source = props
         prop_names = []
-        self._prop_uuid_map = {}  # Reset map
+        self._prop_uuid_map = {}  # Reset maps
+        self._prop_display_names = {}
+        self._any_prop_active = False
+        self._active_prop_uuid = None
 
         # Track name occurrences to make duplicates unique
-        name_counts = {}
+        name_counts: Counter[str] = Counter()
 
         # Add each prop name, making duplicates unique
         for prop in props:
-            prop_data = prop.get("id", {})
-            if isinstance(prop_data, dict):
-                prop_name = prop_data.get("name")
-                prop_uuid = prop_data.get("uuid")
-                if prop_name and prop_uuid:
-                    # Check if we've seen this name before
-                    if prop_name in name_counts:
-                        name_counts[prop_name] += 1
-                        # Make it unique by appending the count
-                        display_name = f"{prop_name} ({name_counts[prop_name]})"
-                    else:
-                        name_counts[prop_name] = 1
-                        display_name = prop_name
-
-                    prop_names.append(display_name)
-                    self._prop_uuid_map[display_name] = prop_uuid
-
-        return prop_names if prop_names else []
+            is_active = prop.get("is_active", False)
+            if is_active:
+                self._any_prop_active = True
+            # The coordinator drops props without an id object
+            prop_data = prop["id"]
+            prop_name = prop_data.get("name")
+            prop_uuid = prop_data.get("uuid")
+            if is_active and prop_uuid and self._active_prop_uuid is None:
+                self._active_prop_uuid = prop_uuid
+            if prop_name and prop_uuid:
+                name_counts[prop_name] += 1
+                count = name_counts[prop_name]
+                # Make repeats unique by appending the count
+                display_name = f"{prop_name} ({count})" if count > 1 else prop_name
+
+                prop_names.append(display_name)
+                self._prop_uuid_map[display_name] = prop_uuid
+                # Keep the first name if a UUID appears twice
+                self._prop_display_names.setdefault(prop_uuid, display_name)
+
+        self._prop_names = prop_names
+
+    @property
+    def source_list(self) -> list[str]:
+        """Return list of available props."""
+        self._update_prop_index()
+        return self._prop_names
 
     @property
     def source(self) -> str | None:
         """Return the currently active prop."""
-        props = self.coordinator.data.get("props", [])
-
-        # Find the active prop UUID
-        active_uuid = None
-        for prop in props:
-            if prop.get("is_active", False):
-                prop_data = prop.get("id", {})
-                if isinstance(prop_data, dict):
-                    active_uuid = prop_data.get("uuid")
-                    break
-
-        if not active_uuid:
+        self._update_prop_index()
+        if not self._active_prop_uuid:
             return None
-
-        # Find the display name for this UUID in our map
-        for display_name, uuid in self._prop_uuid_map.items():
-            if uuid == active_uuid:
-                return display_name
-
-        return None
+        # Active props without a name have no display name
+        return self._prop_display_names.get(self._active_prop_uuid)
 
     @property
     def media_image_url(self) -> str | None:
         """Return the image URL of the current prop."""
-        props = self.coordinator.data.get("props", [])
-
-        # Find the active prop
-        for prop in props:
-            if prop.get("is_active", False):
-                prop_data = prop.get("id", {})
-                if isinstance(prop_data, dict):
-                    prop_uuid = prop_data.get("uuid")
-                    if prop_uuid:
-                        # Return the thumbnail URL
-                        # Use the static coordinator to access API
-                        api = self.static_coordinator.api
-                        return f"http://{api.host}:{api.port}/v1/prop/{prop_uuid}/thumbnail"
-
-        return None
+        self._update_prop_index()
+        prop_uuid = self._active_prop_uuid
+        if not prop_uuid:
+            return None
+        # Use the static coordinator to access API
+        api = self.static_coordinator.api
+        return f"http://{api.host}:{api.port}/v1/prop/{prop_uuid}/thumbnail"
 
     @property
     def media_title(self) -> str | None:
@@ -975,6 +907,7 @@ class ProPresenterPropMediaPlayer(ProPresenterBaseEntity, MediaPlayerEntity):
     async def async_select_source(self, source: str) -> None:
         """Select and trigger a prop."""
         # Look up the UUID from our map
+        self._update_prop_index()
         prop_uuid = self._prop_uuid_map.get(source)
 
         if not prop_uuid:
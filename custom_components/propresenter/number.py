@@ -11,6 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .base import ProPresenterBaseEntity
 from .coordinator import ProPresenterCoordinator, ProPresenterStreamingCoordinator
+from .utils import parse_timer_time
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,32 +27,31 @@ async def async_setup_entry(
         "streaming_coordinator"
     ]
 
-    entities = []
-
-    # Add timer duration number entities
-    timers = coordinator.data.get("timers", [])
-    for timer in timers:
-        timer_data = timer.get("id", {})
-        timer_uuid = timer_data.get("uuid")
-        timer_name = timer_data.get("name")
-
-        # Only create duration entities for countdown timers
-        if timer.get("countdown"):
-            if timer_uuid and timer_name:
-                entities.append(
-                    ProPresenterTimerDurationNumber(
-                        coordinator,
-                        streaming_coordinator,
-                        config_entry,
-                        timer_uuid,
-                        timer_name,
-                        timer,
-                    )
-                )
+    # Only create duration entities for countdown timers
+    entities = [
+        ProPresenterTimerDurationNumber(
+            coordinator,
+            streaming_coordinator,
+            config_entry,
+            timer_data["uuid"],
+            timer_data["name"],
+            timer,
+        )
+        for timer in coordinator.data.get("timers", [])
+        if timer.get("countdown")
+        and (timer_data := timer.get("id", {})).get("uuid")
+        and timer_data.get("name")
+    ]
 
     async_add_entities(entities)
 
 
+def _duration_minutes(seconds: float) -> float:
+    """Return a duration in minutes, as an int if it is a whole number."""
+    minutes, remainder = divmod(seconds, 60)
+    return int(minutes) if remainder == 0 else seconds / 60
+
+
 class ProPresenterTimerDurationNumber(ProPresenterBaseEntity, NumberEntity):
     """Number entity for setting timer duration."""
 
@@ -85,30 +85,15 @@ class ProPresenterTimerDurationNumber(ProPresenterBaseEntity, NumberEntity):
     @property
     def native_value(self) -> float:
         """Return the current timer duration in minutes."""
-        # Read from streaming coordinator (self.coordinator is now streaming)
-        timers = self.coordinator.data.get("timers", [])
-        for timer in timers:
-            timer_data = timer.get("id", {})
-            if timer_data.get("uuid") == self._timer_uuid:
-                seconds = timer.get("countdown", {}).get("duration", 0)
-                minutes = seconds / 60.0
-                # Return int if it's a whole number, otherwise float
-                return int(minutes) if minutes == int(minutes) else minutes
-
-        # Fallback to static coordinator
-        if self.static_coordinator:
-            static_timers = self.static_coordinator.data.get("timers", [])
-            for timer in static_timers:
-                timer_data = timer.get("id", {})
-                if timer_data.get("uuid") == self._timer_uuid:
-                    seconds = timer.get("countdown", {}).get("duration", 0)
-                    minutes = seconds / 60.0
-                    return int(minutes) if minutes == int(minutes) else minutes
-
-        # Final fallback to initial config
-        seconds = self._timer_config.get("countdown", {}).get("duration", 0)
-        minutes = seconds / 60.0
-        return int(minutes) if minutes == int(minutes) else minutes
+        # Read from streaming coordinator (self.coordinator is now streaming),
+        # falling back to the static coordinator, then the initial config
+        timer = self.coordinator.uuid_index("timers").get(self._timer_uuid)
+        if timer is None and self.static_coordinator:
+            timer = self.static_coordinator.uuid_index("timers").get(self._timer_uuid)
+        if timer is None:
+            timer = self._timer_config
+
+        return _duration_minutes(timer.get("countdown", {}).get("duration", 0))
 
     @property
     def extra_state_attributes(self) -> dict:
@@ -133,16 +118,12 @@ class ProPresenterTimerDurationNumber(ProPresenterBaseEntity, NumberEntity):
         duration_seconds = int(value * 60)
 
         # Get the current timer configuration
-        timers = self.coordinator.data.get("timers", [])
-        current_timer = None
-        for timer in timers:
-            timer_data = timer.get("id", {})
-            if timer_data.get("uuid") == self._timer_uuid:
-                current_timer = timer
-                break
+        current_timer = self.coordinator.uuid_index("timers").get(self._timer_uuid)
 
         if not current_timer:
-            _LOGGER.error(f"Could not find timer {self._timer_uuid} to update duration")
+            _LOGGER.error(
+                "Could not find timer %s to update duration", self._timer_uuid
+            )
             return
 
         # Build the PUT request body with the complete timer object
@@ -153,7 +134,10 @@ class ProPresenterTimerDurationNumber(ProPresenterBaseEntity, NumberEntity):
         }
 
         _LOGGER.debug(
-            f"Setting timer {self._timer_name} duration to {duration_seconds}s ({value} min)"
+            "Setting timer %s duration to %ss (%s min)",
+            self._timer_name,
+            duration_seconds,
+            value,
         )
 
         # Use the API to update the timer
@@ -162,12 +146,9 @@ class ProPresenterTimerDurationNumber(ProPresenterBaseEntity, NumberEntity):
         if success:
             # Only reset if timer is fully stopped (reset), not paused mid-countdown
             # Check if current time equals configured duration (stopped) or not (paused)
-            timers_current = self.coordinator.data.get("timers_current", [])
-            current_timer_state = None
-            for timer in timers_current:
-                if timer.get("id", {}).get("uuid") == self._timer_uuid:
-                    current_timer_state = timer
-                    break
+            current_timer_state = self.coordinator.uuid_index("timers_current").get(
+                self._timer_uuid
+            )
 
             should_reset = False
             if current_timer_state:
@@ -175,15 +156,8 @@ class ProPresenterTimerDurationNumber(ProPresenterBaseEntity, NumberEntity):
                 time_str = current_timer_state.get("time", "00:00:00")
 
                 # Parse current time to seconds
-                is_negative = time_str.startswith("-")
-                time_str_clean = time_str.lstrip("-")
-                parts = time_str_clean.split(":")
-                if len(parts) == 3:
-                    hours, minutes, seconds = map(int, parts)
-                    current_seconds = hours * 3600 + minutes * 60 + seconds
-                    if is_negative:
-                        current_seconds = -current_seconds
-
+                current_seconds = parse_timer_time(time_str)
+                if current_seconds is not None:
                     # Get OLD configured duration before we changed it
                     old_duration = current_timer.get("countdown", {}).get("duration", 0)
 
@@ -191,11 +165,18 @@ class ProPresenterTimerDurationNumber(ProPresenterBaseEntity, NumberEntity):
                     if pp_state == "stopped" and current_seconds == old_duration:
                         should_reset = True
                         _LOGGER.debug(
-                            f"Timer is stopped and at reset position ({current_seconds}s == {old_duration}s), will reset to apply new duration"
+                            "Timer is stopped and at reset position (%ss == %ss), "
+                            "will reset to apply new duration",
+                            current_seconds,
+                            old_duration,
                         )
                     else:
                         _LOGGER.debug(
-                            f"Timer is paused or running (state={pp_state}, time={current_seconds}s != {old_duration}s), not resetting"
+                            "Timer is paused or running (state=%s, time=%ss != %ss), "
+                            "not resetting",
+                            pp_state,
+                            current_seconds,
+                            old_duration,
                         )
 
             if should_reset:
@@ -2,21 +2,35 @@
 
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 import asyncio
+from collections import Counter
+from datetime import datetime
 import logging
+from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
 from .base import ProPresenterBaseEntity
 from .coordinator import ProPresenterCoordinator, ProPresenterStreamingCoordinator
-from .utils import get_nested_value
 
 _LOGGER = logging.getLogger(__name__)
 
+# Placeholder options shown when there is nothing to select
+_NO_LAYOUTS = ("No layouts available",)
+_NO_PLAYLISTS = ("No Playlists",)
+_NO_AUDIO_TRACKS = ("No Audio Tracks",)
+_NO_VIDEO_INPUTS = ("No video inputs available",)
+_AUDIO_PLACEHOLDERS = frozenset({*_NO_PLAYLISTS, "No Tracks", *_NO_AUDIO_TRACKS})
+
+# Seconds a triggered macro or video input stays selected before resetting
+_SELECTION_RESET_DELAY = 0.5
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -30,36 +44,34 @@ async def async_setup_entry(
     ]
 
     # Get stage screens from streaming coordinator data
-    stage_screens = streaming_coordinator.data.get("stage_screens", [])
+    stage_screens = streaming_coordinator.data.get("stage_screens", ())
 
     # Create a select entity for each stage screen
-    entities = []
-    for screen in stage_screens:
-        # ProPresenter uses 'uuid' not 'id' for stage screens
-        screen_id = screen.get("uuid") or screen.get("id")
-        if screen_id:
-            entities.append(
-                ProPresenterStageLayoutSelect(
-                    coordinator, streaming_coordinator, config_entry, screen_id
-                )
-            )
+    # ProPresenter uses 'uuid' not 'id' for stage screens
+    entities: list[SelectEntity] = [
+        ProPresenterStageLayoutSelect(
+            coordinator, streaming_coordinator, config_entry, screen_id
+        )
+        for screen in stage_screens
+        if (screen_id := screen.get("uuid") or screen.get("id"))
+    ]
 
     # Props are now handled by media_player platform (ProPresenterPropMediaPlayer)
 
     # Create a select entity for looks (from streaming coordinator)
-    looks = streaming_coordinator.data.get("looks", [])
+    looks = streaming_coordinator.data.get("looks", ())
     if looks:
         entities.append(
             ProPresenterLookSelect(coordinator, streaming_coordinator, config_entry)
         )
 
     # Create a select entity for macros
-    macros = coordinator.data.get("macros", [])
+    macros = coordinator.data.get("macros", ())
     if macros:
         entities.append(ProPresenterMacroSelect(coordinator, config_entry))
 
     # Create a select entity for video inputs
-    video_inputs = coordinator.data.get("video_inputs", [])
+    video_inputs = coordinator.data.get("video_inputs", ())
     if video_inputs:
         entities.append(
             ProPresenterVideoInputSelect(
@@ -75,6 +87,92 @@ async def async_setup_entry(
         )
 
 
+class CachedOptionsMixin(ABC):
+    """Mixin for selects whose options are built from one coordinator list.
+
+    HA reads the options on every state write. Coordinator lists are replaced
+    rather than mutated when they change, so the options are only rebuilt
+    when the list they were built from is replaced.
+    """
+
+    _options_built_from: Any = None
+    _cached_options: list[str]
+
+    @abstractmethod
+    def _options_data(self) -> Any:
+        """Return the coordinator data the options are built from."""
+
+    @abstractmethod
+    def _build_options(self, data: Any) -> list[str]:
+        """Build the options (and any lookups kept with them) from the data."""
+
+    def _update_options(self) -> None:
+        """Rebuild the options if their coordinator data was replaced.
+
+        Actions that read lookups built with the options call this first, so
+        they don't depend on HA having read the options since the data changed.
+        """
+        data = self._options_data()
+        if data is not self._options_built_from:
+            self._cached_options = self._build_options(data)
+            self._options_built_from = data
+
+    @property
+    def options(self) -> list[str]:
+        """Return the options, rebuilt when their coordinator data is replaced."""
+        self._update_options()
+        return self._cached_options
+
+
+class TriggerSelectionMixin:
+    """Mixin for selects that trigger an action and then reset.
+
+    The triggered option stays selected briefly so the frontend shows it. The
+    reset is scheduled rather than awaited, so the service call returns as soon
+    as the action is triggered, and a new trigger restarts the delay.
+    """
+
+    _default_option: str
+    _current_selection: str
+    _cancel_reset: CALLBACK_TYPE | None = None
+
+    @property
+    def current_option(self) -> str:
+        """Return the current selection."""
+        return self._current_selection
+
+    def _show_triggered(self, option: str) -> None:
+        """Show the triggered option, cancelling any pending reset."""
+        self._cancel_pending_reset()
+        self._current_selection = option
+        self.async_write_ha_state()
+
+    def _schedule_reset(self) -> None:
+        """Reset to the default option after a brief delay."""
+        self._cancel_pending_reset()
+        self._cancel_reset = async_call_later(
+            self.hass, _SELECTION_RESET_DELAY, self._reset_selection
+        )
+
+    @callback
+    def _reset_selection(self, _now: datetime | None = None) -> None:
+        """Reset to the default option now."""
+        self._cancel_pending_reset()
+        self._current_selection = self._default_option
+        self.async_write_ha_state()
+
+    def _cancel_pending_reset(self) -> None:
+        """Cancel a scheduled reset, if any."""
+        if self._cancel_reset is not None:
+            self._cancel_reset()
+            self._cancel_reset = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a scheduled reset when removed."""
+        self._cancel_pending_reset()
+        await super().async_will_remove_from_hass()
+
+
 class ProPresenterStageLayoutSelect(ProPresenterBaseEntity, SelectEntity):
     """Select entity for choosing stage layout on a specific screen."""
 
@@ -100,84 +198,48 @@ class ProPresenterStageLayoutSelect(ProPresenterBaseEntity, SelectEntity):
     def name(self) -> str:
         """Return the name of the entity."""
         # Get screen name from streaming coordinator data (self.coordinator is the streaming coordinator)
-        stage_screens = self.coordinator.data.get("stage_screens", [])
-        for screen in stage_screens:
-            # Check both 'uuid' and 'id' fields
-            screen_id = screen.get("uuid") or screen.get("id")
-            if screen_id == self._screen_id:
-                screen_name = screen.get("name", f"Screen {self._screen_id}")
-                return f"{screen_name} layout"
+        screen = self.coordinator.stage_layout_index().screens.get(self._screen_id)
+        if screen is not None:
+            screen_name = screen.get("name", f"Screen {self._screen_id}")
+            return f"{screen_name} layout"
         return f"Stage screen {self._screen_id} layout"
 
     @property
     def options(self) -> list[str]:
-        """Return list of available stage layouts."""
-        # Get layouts from streaming coordinator data (self.coordinator is the streaming coordinator)
-        stage_layouts = self.coordinator.data.get("stage_layouts", [])
-        layout_names = []
-
-        for layout in stage_layouts:
-            # ProPresenter nests layout info under 'id' key
-            layout_data = layout.get("id", {})
-            layout_name = (
-                layout_data.get("name")
-                if isinstance(layout_data, dict)
-                else layout.get("name")
-            )
-            if layout_name:
-                layout_names.append(layout_name)
-
-        return layout_names if layout_names else ["No layouts available"]
+        """Return the available stage layouts."""
+        # Built once in the index shared by every stage screen's select
+        layout_options = self.coordinator.stage_layout_index().layout_options
+        return layout_options if layout_options else list(_NO_LAYOUTS)
 
     @property
     def current_option(self) -> str | None:
         """Return the currently selected layout."""
-        # Get layout map and layouts from streaming coordinator data (self.coordinator is the streaming coordinator)
-        layout_map = self.coordinator.data.get("layout_map", [])
-        stage_layouts = self.coordinator.data.get("stage_layouts", [])
+        index = self.coordinator.stage_layout_index()
 
-        # Find the current layout UUID for this screen
+        # Find the current layout for this screen
         # Layout map format: [{"screen": {"uuid": "..."}, "layout": {"uuid": "...", "name": "..."}}]
-        current_layout_uuid = None
-        for mapping in layout_map:
-            screen_data = mapping.get("screen", {})
-            screen_uuid = screen_data.get("uuid") or screen_data.get("id")
-
-            if screen_uuid == self._screen_id:
-                layout_data = mapping.get("layout", {})
-                current_layout_uuid = layout_data.get("uuid")
-                # Can also get the name directly from here
-                current_layout_name = layout_data.get("name")
-                if current_layout_name:
-                    return current_layout_name
-                break
+        layout_data = index.screen_layouts.get(self._screen_id)
+        if layout_data is None:
+            return None
+
+        # Can get the name directly from the layout map
+        current_layout_name = layout_data.get("name")
+        if current_layout_name:
+            return current_layout_name
 
         # If no layout is assigned, return None
+        current_layout_uuid = layout_data.get("uuid")
         if not current_layout_uuid:
             return None
 
         # Find the layout name from the layout UUID
-        for layout in stage_layouts:
-            layout_uuid = get_nested_value(layout, "id", "uuid")
-            layout_name = get_nested_value(layout, "id", "name")
-
-            if layout_uuid == current_layout_uuid:
-                return layout_name
-
-        return None
+        return index.layout_names.get(current_layout_uuid)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected layout."""
-        # Get layouts from streaming coordinator data (self.coordinator is the streaming coordinator)
-        stage_layouts = self.coordinator.data.get("stage_layouts", [])
-
         # Find the layout UUID for the selected layout name
-        selected_layout_uuid = None
-        for layout in stage_layouts:
-            layout_name = get_nested_value(layout, "id", "name")
-            if layout_name == option:
-                selected_layout_uuid = get_nested_value(layout, "id", "uuid")
-                break
+        index = self.coordinator.stage_layout_index()
+        selected_layout_uuid = index.layout_uuids.get(option)
 
         if not selected_layout_uuid:
             _LOGGER.error("Could not find layout UUID for: %s", option)
@@ -196,7 +258,7 @@ class ProPresenterStageLayoutSelect(ProPresenterBaseEntity, SelectEntity):
         # No need to request refresh - streaming will update automatically
 
 
-class ProPresenterPropSelect(ProPresenterBaseEntity, SelectEntity):
+class ProPresenterPropSelect(CachedOptionsMixin, ProPresenterBaseEntity, SelectEntity):
     """Select entity for choosing which prop to display."""
 
     _attr_name = "Active prop"
@@ -215,71 +277,69 @@ class ProPresenterPropSelect(ProPresenterBaseEntity, SelectEntity):
         self.api = static_coordinator.api  # Keep reference to API for actions
         self._attr_unique_id = f"{config_entry.entry_id}_active_prop"
         self._prop_uuid_map = {}  # Map display names to UUIDs
+        self._prop_display_names = {}  # And UUIDs back to names
+        self._active_prop_id: dict[str, Any] | None = None  # First active prop
 
-    @property
-    def options(self) -> list[str]:
-        """Return list of available props with unique display names."""
-        props = self.coordinator.data.get("props", [])
+    def _options_data(self) -> Any:
+        """Return the props the options are built from."""
+        return self.coordinator.data.get("props") or ()
+
+    def _build_options(self, props: Any) -> list[str]:
+        """Build the list of available props with unique display names."""
         prop_names = []
-        self._prop_uuid_map = {}  # Reset map
+        prop_uuid_map = {}
+        prop_display_names = {}
+        active_prop_id = None
 
         # Add "None" option for clearing all props
         prop_names.append("None")
 
         # Track name occurrences to make duplicates unique
-        name_counts = {}
+        name_counts: Counter[str] = Counter()
 
         # Add each prop name, making duplicates unique
         for prop in props:
-            prop_data = prop.get("id", {})
-            if isinstance(prop_data, dict):
-                prop_name = prop_data.get("name")
-                prop_uuid = prop_data.get("uuid")
-                if prop_name and prop_uuid:
-                    # Check if we've seen this name before
-                    if prop_name in name_counts:
-                        name_counts[prop_name] += 1
-                        # Make it unique by appending the count
-                        display_name = f"{prop_name} ({name_counts[prop_name]})"
-                    else:
-                        name_counts[prop_name] = 1
-                        display_name = prop_name
-
-                    prop_names.append(display_name)
-                    self._prop_uuid_map[display_name] = prop_uuid
-
+            # The coordinator drops props without an id object
+            prop_data = prop["id"]
+            if active_prop_id is None and prop.get("is_active", False):
+                active_prop_id = prop_data
+            prop_name = prop_data.get("name")
+            prop_uuid = prop_data.get("uuid")
+            if prop_name and prop_uuid:
+                name_counts[prop_name] += 1
+                count = name_counts[prop_name]
+                # Make repeats unique by appending the count
+                display_name = f"{prop_name} ({count})" if count > 1 else prop_name
+
+                prop_names.append(display_name)
+                prop_uuid_map[display_name] = prop_uuid
+                # Keep the first name if a UUID appears twice
+                prop_display_names.setdefault(prop_uuid, display_name)
+
+        self._prop_uuid_map = prop_uuid_map
+        self._prop_display_names = prop_display_names
+        self._active_prop_id = active_prop_id
         return prop_names
 
     @property
     def current_option(self) -> str | None:
         """Return the currently active prop."""
-        props = self.coordinator.data.get("props", [])
-
-        # Find the active prop UUID
-        active_uuid = None
-        for prop in props:
-            if prop.get("is_active", False):
-                prop_data = prop.get("id", {})
-                if isinstance(prop_data, dict):
-                    active_uuid = prop_data.get("uuid")
-                    break
+        # Props are replaced when one is activated, so the active prop is
+        # found while building the options rather than on every read
+        self._update_options()
+        active_data = self._active_prop_id
 
+        active_uuid = active_data.get("uuid") if active_data else None
         if not active_uuid:
             return "None"
 
         # Find the display name for this UUID in our map
-        for display_name, uuid in self._prop_uuid_map.items():
-            if uuid == active_uuid:
-                return display_name
+        display_name = self._prop_display_names.get(active_uuid)
+        if display_name:
+            return display_name
 
         # Fallback: return the name without decoration
-        for prop in props:
-            if prop.get("is_active", False):
-                prop_data = prop.get("id", {})
-                if isinstance(prop_data, dict):
-                    return prop_data.get("name")
-
-        return "None"
+        return active_data.get("name")
 
     async def async_select_option(self, option: str) -> None:
         """Trigger the selected prop."""
@@ -288,6 +348,7 @@ class ProPresenterPropSelect(ProPresenterBaseEntity, SelectEntity):
             await self.api.trigger_clear_layer("props")
         else:
             # Look up the UUID from our map
+            self._update_options()
             selected_prop_uuid = self._prop_uuid_map.get(option)
 
             if not selected_prop_uuid:
@@ -300,7 +361,9 @@ class ProPresenterPropSelect(ProPresenterBaseEntity, SelectEntity):
         # No need to request refresh - streaming will update automatically
 
 
-class ProPresenterAudioTrackSelect(ProPresenterBaseEntity, SelectEntity):
+class ProPresenterAudioTrackSelect(
+    CachedOptionsMixin, ProPresenterBaseEntity, SelectEntity
+):
     """Select entity for audio tracks."""
 
     _attr_name = "Audio Track"
@@ -315,47 +378,20 @@ class ProPresenterAudioTrackSelect(ProPresenterBaseEntity, SelectEntity):
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{config_entry.entry_id}_audio_track"
 
-    @property
-    def options(self) -> list[str]:
-        """Return the list of available audio tracks from all playlists."""
-        audio_playlist_details_list = self.coordinator.data.get(
-            "audio_playlist_details_list", []
-        )
+    def _options_data(self) -> Any:
+        """Return the audio playlist details the options are built from."""
+        return self.coordinator.data.get("audio_playlist_details_list") or ()
 
+    def _build_options(self, audio_playlist_details_list: Any) -> list[str]:
+        """Build the list of available audio tracks from all playlists."""
         if not audio_playlist_details_list:
-            return ["No Playlists"]
+            return list(_NO_PLAYLISTS)
 
-        track_options = []
-
-        # Iterate through all playlists
-        for playlist_details in audio_playlist_details_list:
-            playlist_name = get_nested_value(
-                playlist_details, "id", "name", default="Unknown Playlist"
-            )
-            items = playlist_details.get("items", [])
-
-            if not items:
-                continue
-
-            # Add tracks from this playlist
-            for item in items:
-                if item.get("type") == "audio":
-                    track_name = get_nested_value(
-                        item, "id", "name", default="Unknown Track"
-                    )
-                    # Remove .mp3 extension if present for cleaner display
-                    if track_name.endswith(".mp3"):
-                        track_name = track_name[:-4]
-
-                    # Format as "Playlist Name - Track Name" if multiple playlists
-                    if len(audio_playlist_details_list) > 1:
-                        display_name = f"{playlist_name} - {track_name}"
-                    else:
-                        display_name = track_name
-
-                    track_options.append(display_name)
-
-        return track_options if track_options else ["No Audio Tracks"]
+        # Names are "Playlist Name - Track Name" if there are multiple playlists
+        track_options = self.coordinator.playlist_item_index(
+            "audio_playlist_details_list"
+        ).display_names
+        return track_options if track_options else list(_NO_AUDIO_TRACKS)
 
     @property
     def current_option(self) -> str | None:
@@ -366,65 +402,28 @@ class ProPresenterAudioTrackSelect(ProPresenterBaseEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Select an audio track to play from any playlist."""
-        if option in ["No Playlists", "No Tracks", "No Audio Tracks"]:
+        if option in _AUDIO_PLACEHOLDERS:
             return
 
         try:
             audio_playlist_details_list = self.coordinator.data.get(
-                "audio_playlist_details_list", []
+                "audio_playlist_details_list", ()
             )
 
             if not audio_playlist_details_list:
                 _LOGGER.error("No audio playlist data available")
                 return
 
-            # Search through all playlists to find the track
-            playlist_uuid = None
-            track_uuid = None
-            found = False
-
-            for playlist_details in audio_playlist_details_list:
-                current_playlist_uuid = get_nested_value(playlist_details, "id", "uuid")
-                playlist_name = get_nested_value(
-                    playlist_details, "id", "name", default="Unknown Playlist"
-                )
-                items = playlist_details.get("items", [])
-
-                for item in items:
-                    if item.get("type") == "audio":
-                        track_name = get_nested_value(item, "id", "name", default="")
-                        # Remove .mp3 extension for comparison
-                        display_track_name = (
-                            track_name[:-4]
-                            if track_name.endswith(".mp3")
-                            else track_name
-                        )
-
-                        # Check if this is the selected track
-                        # Handle both "Playlist - Track" and "Track" formats
-                        if len(audio_playlist_details_list) > 1:
-                            full_display_name = (
-                                f"{playlist_name} - {display_track_name}"
-                            )
-                            if full_display_name == option:
-                                playlist_uuid = current_playlist_uuid
-                                track_uuid = get_nested_value(item, "id", "uuid")
-                                found = True
-                                break
-                        else:
-                            if display_track_name == option or track_name == option:
-                                playlist_uuid = current_playlist_uuid
-                                track_uuid = get_nested_value(item, "id", "uuid")
-                                found = True
-                                break
-
-                if found:
-                    break
-
-            if not playlist_uuid or not track_uuid:
+            # Handles both "Playlist - Track" and "Track" formats
+            track = self.coordinator.playlist_item_index(
+                "audio_playlist_details_list"
+            ).items.get(option)
+            if not track:
                 _LOGGER.error(f"Could not find track: {option}")
                 return
 
+            playlist_uuid, track_uuid = track
+
             _LOGGER.debug(
                 f"Triggering audio track: {option} (playlist: {playlist_uuid}, track: {track_uuid})"
             )
@@ -435,7 +434,7 @@ class ProPresenterAudioTrackSelect(ProPresenterBaseEntity, SelectEntity):
             raise
 
 
-class ProPresenterLookSelect(ProPresenterBaseEntity, SelectEntity):
+class ProPresenterLookSelect(CachedOptionsMixin, ProPresenterBaseEntity, SelectEntity):
     """Select entity for choosing ProPresenter looks."""
 
     _attr_translation_key = "look"
@@ -457,10 +456,12 @@ class ProPresenterLookSelect(ProPresenterBaseEntity, SelectEntity):
         self._pending_look: str | None = None
         self._processing_lock = asyncio.Lock()
 
-    @property
-    def options(self) -> list[str]:
-        """Return list of available looks."""
-        looks = self.coordinator.data.get("looks", [])
+    def _options_data(self) -> Any:
+        """Return the looks the options are built from."""
+        return self.coordinator.data.get("looks") or ()
+
+    def _build_options(self, looks: Any) -> list[str]:
+        """Build the list of available looks."""
         look_names = []
 
         for look in looks:
@@ -492,13 +493,14 @@ class ProPresenterLookSelect(ProPresenterBaseEntity, SelectEntity):
             # Store the pending look
             self._pending_look = option
 
-            looks = self.coordinator.data.get("looks", [])
+            looks = self.coordinator.data.get("looks", ())
 
             # Find the look UUID by name
             look_uuid = None
             for look in looks:
-                if get_nested_value(look, "id", "name") == option:
-                    look_uuid = get_nested_value(look, "id", "uuid")
+                look_id = look.get("id")
+                if isinstance(look_id, dict) and look_id.get("name") == option:
+                    look_uuid = look_id.get("uuid")
                     break
 
             if not look_uuid:
@@ -508,24 +510,22 @@ class ProPresenterLookSelect(ProPresenterBaseEntity, SelectEntity):
 
             try:
                 # Trigger the look
-                await self.api.trigger_look(look_uuid)
-
                 # No need to poll - streaming will update automatically
-                self._pending_look = None
-
-            except Exception as e:
-                _LOGGER.error("Error setting look %s: %s", option, e)
-                self._pending_look = None
+                await self.api.trigger_look(look_uuid)
             except Exception as e:
-                _LOGGER.error("Error triggering look: %s", e, exc_info=True)
+                _LOGGER.error("Error setting look %s: %s", option, e, exc_info=True)
+            finally:
                 self._pending_look = None
 
 
-class ProPresenterMacroSelect(ProPresenterBaseEntity, SelectEntity):
+class ProPresenterMacroSelect(
+    TriggerSelectionMixin, CachedOptionsMixin, ProPresenterBaseEntity, SelectEntity
+):
     """Select entity for triggering macros."""
 
     _attr_icon = "mdi:alpha-m-box-outline"
     _attr_name = "Trigger Macro"
+    _default_option = "Select Macro"
 
     def __init__(
         self,
@@ -539,58 +539,53 @@ class ProPresenterMacroSelect(ProPresenterBaseEntity, SelectEntity):
         self._current_selection = "Select Macro"
         self._macro_uuid_map = {}  # Map display names to UUIDs
 
-    @property
-    def options(self) -> list[str]:
-        """Return the list of available macro names with unique display names."""
+    def _options_data(self) -> Any:
+        """Return the macros the options are built from."""
+        return self.coordinator.data.get("macros") or ()
+
+    def _build_options(self, macros: Any) -> list[str]:
+        """Build the list of available macro names with unique display names."""
         # Always include "Select Macro" as the first/default option
         macro_names = ["Select Macro"]
-        self._macro_uuid_map = {}  # Reset map
+        macro_uuid_map = {}
 
         # Track name occurrences to make duplicates unique
-        name_counts = {}
+        name_counts: Counter[str] = Counter()
 
-        macros = self.coordinator.data.get("macros", [])
         for macro in macros:
             macro_id = macro.get("id", {})
             if isinstance(macro_id, dict):
                 macro_name = macro_id.get("name")
                 macro_uuid = macro_id.get("uuid")
                 if macro_name and macro_uuid:
-                    # Check if we've seen this name before
-                    if macro_name in name_counts:
-                        name_counts[macro_name] += 1
-                        # Make it unique by appending the count
-                        display_name = f"{macro_name} ({name_counts[macro_name]})"
-                    else:
-                        name_counts[macro_name] = 1
-                        display_name = macro_name
+                    name_counts[macro_name] += 1
+                    count = name_counts[macro_name]
+                    # Make repeats unique by appending the count
+                    display_name = (
+                        f"{macro_name} ({count})" if count > 1 else macro_name
+                    )
 
                     macro_names.append(display_name)
-                    self._macro_uuid_map[display_name] = macro_uuid
+                    macro_uuid_map[display_name] = macro_uuid
 
+        self._macro_uuid_map = macro_uuid_map
         return macro_names
 
-    @property
-    def current_option(self) -> str:
-        """Return the current selection."""
-        return self._current_selection
-
     async def async_select_option(self, option: str) -> None:
         """Trigger the selected macro and reset to Select Macro."""
         if option == "Select Macro":
             # Just update the state
-            self._current_selection = "Select Macro"
-            self.async_write_ha_state()
+            self._reset_selection()
             return
 
         try:
             _LOGGER.debug("Triggering macro: %s", option)
 
             # Temporarily set to the selected option so frontend sees the change
-            self._current_selection = option
-            self.async_write_ha_state()
+            self._show_triggered(option)
 
             # Look up the UUID from our map
+            self._update_options()
             macro_uuid = self._macro_uuid_map.get(option)
 
             if macro_uuid:
@@ -599,21 +594,18 @@ class ProPresenterMacroSelect(ProPresenterBaseEntity, SelectEntity):
             else:
                 _LOGGER.error("Could not find UUID for macro: %s", option)
 
-            # Reset to "Select Macro" after triggering
-            import asyncio
-
-            await asyncio.sleep(0.5)  # Brief delay so user sees selection
-            self._current_selection = "Select Macro"
-            self.async_write_ha_state()
+            # Reset to "Select Macro" once the user has seen the selection
+            self._schedule_reset()
 
         except Exception as e:
             _LOGGER.error("Error triggering macro: %s", e, exc_info=True)
             # Reset to Select Macro even on error
-            self._current_selection = "Select Macro"
-            self.async_write_ha_state()
+            self._reset_selection()
 
 
-class ProPresenterVideoInputSelect(ProPresenterBaseEntity, SelectEntity):
+class ProPresenterVideoInputSelect(
+    TriggerSelectionMixin, CachedOptionsMixin, ProPresenterBaseEntity, SelectEntity
+):
     """Select entity for triggering video inputs.
 
     Note: ProPresenter API does not provide feedback on which video input
@@ -622,6 +614,7 @@ class ProPresenterVideoInputSelect(ProPresenterBaseEntity, SelectEntity):
 
     _attr_icon = "mdi:message-video"
     _attr_name = "Trigger Video Input"
+    _default_option = "Select Video Input"
 
     def __init__(
         self,
@@ -637,48 +630,38 @@ class ProPresenterVideoInputSelect(ProPresenterBaseEntity, SelectEntity):
         self._attr_unique_id = f"{config_entry.entry_id}_video_input"
         self._current_selection = "Select Video Input"
 
-    @property
-    def options(self) -> list[str]:
-        """Return list of available video inputs."""
+    def _options_data(self) -> Any:
+        """Return the video inputs the options are built from."""
+        # Get video inputs from static coordinator data
+        return self.static_coordinator.data.get("video_inputs") or ()
+
+    def _build_options(self, video_inputs: Any) -> list[str]:
+        """Build the list of available video inputs."""
         # Always include "Select Video Input" as the first/default option
         input_names = ["Select Video Input"]
 
-        # Get video inputs from static coordinator data
-        video_inputs = self.static_coordinator.data.get("video_inputs", [])
-
         for video_input in video_inputs:
             input_name = video_input.get("name")
             if input_name:
                 input_names.append(input_name)
 
-        return input_names if len(input_names) > 1 else ["No video inputs available"]
-
-    @property
-    def current_option(self) -> str:
-        """Return the current selection.
-
-        Note: ProPresenter does not provide feedback on active video input,
-        so this always returns to the default after triggering.
-        """
-        return self._current_selection
+        return input_names if len(input_names) > 1 else list(_NO_VIDEO_INPUTS)
 
     async def async_select_option(self, option: str) -> None:
         """Trigger the selected video input and reset to default."""
         if option == "Select Video Input":
             # Just update the state
-            self._current_selection = "Select Video Input"
-            self.async_write_ha_state()
+            self._reset_selection()
             return
 
         try:
             _LOGGER.debug("Triggering video input: %s", option)
 
             # Temporarily set to the selected option so frontend sees the change
-            self._current_selection = option
-            self.async_write_ha_state()
+            self._show_triggered(option)
 
             # Get video inputs from static coordinator data
-            video_inputs = self.static_coordinator.data.get("video_inputs", [])
+            video_inputs = self.static_coordinator.data.get("video_inputs", ())
 
             # Find the UUID for the selected video input name
             selected_uuid = None
@@ -687,34 +670,25 @@ class ProPresenterVideoInputSelect(ProPresenterBaseEntity, SelectEntity):
                     selected_uuid = video_input.get("uuid")
                     break
 
-            if selected_uuid:
-                # Trigger the video input
-                await self.api.trigger_video_input(selected_uuid)
-
-                # Reset to "Select Video Input" after triggering
-                await asyncio.sleep(0.5)  # Brief delay so user sees selection
-                self._current_selection = "Select Video Input"
-                self.async_write_ha_state()
-            else:
+            if not selected_uuid:
                 _LOGGER.error("Could not find UUID for video input: %s", option)
                 raise HomeAssistantError(f"Could not find video input: {option}")
 
-            # Reset to "Select Video Input" after triggering
-            await asyncio.sleep(0.5)  # Brief delay so user sees selection
-            self._current_selection = "Select Video Input"
-            self.async_write_ha_state()
+            # Trigger the video input
+            await self.api.trigger_video_input(selected_uuid)
+
+            # Reset to "Select Video Input" once the user has seen the selection
+            self._schedule_reset()
 
         except HomeAssistantError:
             # Re-raise HomeAssistantError to show to user
-            self._current_selection = "Select Video Input"
-            self.async_write_ha_state()
+            self._reset_selection()
             raise
         except Exception as err:
             _LOGGER.error("Error triggering video input '%s': %s", option, err)
 
             # Reset and show error to user
-            self._current_selection = "Select Video Input"
-            self.async_write_ha_state()
+            self._reset_selection()
             raise HomeAssistantError(
                 f"Failed to trigger video input '{option}'. "
                 "Note: ProPresenter does not provide feedback on which video input is currently active."
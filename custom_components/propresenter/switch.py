@@ -12,6 +12,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .base import ProPresenterBaseEntity
 from .coordinator import ProPresenterCoordinator, ProPresenterStreamingCoordinator
+from .utils import parse_timer_time
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -510,19 +511,7 @@ class ProPresenterTimerSwitch(ProPresenterBaseEntity, SwitchEntity):
 
     def _parse_time_to_seconds(self, time_str: str) -> int:
         """Parse time string (HH:MM:SS or -HH:MM:SS) to seconds."""
-        if not time_str:
-            return 0
-
-        # Handle negative time (overrun)
-        is_negative = time_str.startswith("-")
-        time_str = time_str.lstrip("-")
-
-        parts = time_str.split(":")
-        if len(parts) == 3:
-            hours, minutes, seconds = map(int, parts)
-            total_seconds = hours * 3600 + minutes * 60 + seconds
-            return -total_seconds if is_negative else total_seconds
-        return 0
+        return parse_timer_time(time_str) or 0
 
     def _get_current_timer_state(self) -> dict | None:
         """Get current timer state from streaming coordinator."""
@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Iterable, Sequence
+import re
+from typing import Any, NamedTuple
+
+# Timer times as ProPresenter reports them: HH:MM:SS, "-" prefixed on overrun
+_TIMER_TIME_RE = re.compile(r"(-?)(\d+):(\d+):(\d+)")
+
+# Sentinel for keys missing from a dict (None is a valid value)
+_MISSING = object()
 
 
 def get_nested_value(data: dict[str, Any], *keys: str, default: Any = None) -> Any:
@@ -22,11 +30,15 @@ def get_nested_value(data: dict[str, Any], *keys: str, default: Any = None) -> A
     """
     result = data
     for key in keys:
-        if isinstance(result, dict):
-            result = result.get(key, {})
-        else:
+        if not isinstance(result, dict):
+            return default
+        result = result.get(key, _MISSING)
+        if result is _MISSING:
             return default
-    return result if result != {} else default
+    # An empty dict counts as missing
+    if isinstance(result, dict) and not result:
+        return default
+    return result
 
 
 def generate_slide_label(slide: dict[str, Any], slide_index: int) -> str:
@@ -79,11 +91,183 @@ def collect_playlist_uuids(items: list[dict[str, Any]], uuids_list: list[str]) -
     """
     for item in items:
         field_type = item.get("field_type", "")
-        playlist_uuid = get_nested_value(item, "id", "uuid")
 
-        if field_type == "playlist" and playlist_uuid:
-            uuids_list.append(playlist_uuid)
+        if field_type == "playlist":
+            playlist_uuid = (item.get("id") or {}).get("uuid")
+            if playlist_uuid:
+                uuids_list.append(playlist_uuid)
         elif field_type == "group":
             children = item.get("children", [])
             if children:
                 collect_playlist_uuids(children, uuids_list)
+
+
+class PlaylistItemIndex(NamedTuple):
+    """Lookups over the items of a list of playlist details."""
+
+    # Display names in playlist order, as shown in source/option lists
+    display_names: list[str]
+    # Display name (or bare item name) -> (playlist UUID, item UUID)
+    items: dict[str, tuple[str, str]]
+    # Item names as reported by the transport
+    names: frozenset[str]
+
+
+def build_playlist_item_index(
+    playlist_details_list: Sequence[dict[str, Any]],
+    item_type: str | None = None,
+    default_name: str = "",
+    strip_suffix: str = "",
+) -> PlaylistItemIndex:
+    """Index playlist items by the display name shown in source/option lists.
+
+    Display names are prefixed with the playlist name when there is more than
+    one playlist. With a single playlist the bare item name also resolves.
+
+    Args:
+        playlist_details_list: Playlist details with their items
+        item_type: Only index items of this type, or all items if None
+        default_name: Name for items without one (items are skipped if empty)
+        strip_suffix: File extension hidden from display names
+
+    Returns:
+        The index of the playlists' items
+    """
+    display_names: list[str] = []
+    items: dict[str, tuple[str, str]] = {}
+    names: set[str] = set()
+    prefix_playlist = len(playlist_details_list) > 1
+
+    for playlist_details in playlist_details_list:
+        playlist_id = playlist_details.get("id") if playlist_details else None
+        if not playlist_id:
+            continue
+
+        playlist_uuid = playlist_id.get("uuid")
+        playlist_name = playlist_id.get("name", "Unknown Playlist")
+
+        for item in playlist_details.get("items", []):
+            if not item or (item_type and item.get("type") != item_type):
+                continue
+
+            item_id = item.get("id") or {}
+            item_name = item_id.get("name") or default_name
+            if not item_name:
+                continue
+            names.add(item_name)
+
+            track_name = item_name.removesuffix(strip_suffix)
+            if prefix_playlist:
+                display_name = f"{playlist_name} - {track_name}"
+            else:
+                display_name = track_name
+            display_names.append(display_name)
+
+            # First match wins, as when the playlists were searched in order
+            item_uuid = item_id.get("uuid")
+            if playlist_uuid and item_uuid:
+                items.setdefault(display_name, (playlist_uuid, item_uuid))
+                if not prefix_playlist:
+                    items.setdefault(item_name, (playlist_uuid, item_uuid))
+
+    return PlaylistItemIndex(display_names, items, frozenset(names))
+
+
+def index_by_uuid(items: Iterable[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Index API items (timers, props, ...) by the UUID in their "id" field.
+
+    Args:
+        items: Items with an "id" dict holding their UUID
+
+    Returns:
+        The items keyed by UUID, keeping the first item for a repeated UUID
+    """
+    index: dict[str, dict[str, Any]] = {}
+    for item in items:
+        item_id = item.get("id")
+        if isinstance(item_id, dict):
+            uuid = item_id.get("uuid")
+            if uuid:
+                index.setdefault(uuid, item)
+    return index
+
+
+def parse_timer_time(time_str: str | None) -> int | None:
+    """Parse a timer time (HH:MM:SS or -HH:MM:SS) to seconds.
+
+    Args:
+        time_str: Time string from the timers/current stream
+
+    Returns:
+        The time in seconds (negative on overrun), or None if not a timer time
+    """
+    match = _TIMER_TIME_RE.fullmatch(time_str) if time_str else None
+    if match is None:
+        return None
+    sign, hours, minutes, seconds = match.groups()
+    total_seconds = int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+    return -total_seconds if sign else total_seconds
+
+
+class StageLayoutIndex(NamedTuple):
+    """Stage screens and layouts, and the layout assigned to each screen."""
+
+    screens: dict[str, dict[str, Any]]  # Screen UUID (or id) -> screen
+    layout_names: dict[str, str | None]  # Layout UUID -> name
+    layout_uuids: dict[str, str | None]  # Layout name -> UUID
+    screen_layouts: dict[str, dict[str, Any]]  # Screen UUID -> assigned layout
+    layout_options: list[str]  # Layout names in order, as shown in the selects
+
+
+def build_stage_layout_index(
+    stage_screens: Iterable[dict[str, Any]],
+    stage_layouts: Iterable[dict[str, Any]],
+    layout_map: Iterable[dict[str, Any]],
+) -> StageLayoutIndex:
+    """Index the stage screens, layouts and screen to layout assignments.
+
+    For repeated keys the first entry wins, matching a linear scan.
+
+    Args:
+        stage_screens: Stage screens, identified by "uuid" (or "id")
+        stage_layouts: Stage layouts with their UUID and name under "id"
+        layout_map: Assignments of a layout to each stage screen
+
+    Returns:
+        The index of the layouts and assignments
+    """
+    screens: dict[str, dict[str, Any]] = {}
+    for screen in stage_screens:
+        screen_id = screen.get("uuid") or screen.get("id")
+        if screen_id:
+            screens.setdefault(screen_id, screen)
+
+    layout_names: dict[str, str | None] = {}
+    layout_uuids: dict[str, str | None] = {}
+    layout_options: list[str] = []
+    for layout in stage_layouts:
+        layout_id = layout.get("id", {})
+        if not isinstance(layout_id, dict):
+            # Layouts without an id object may carry their name directly
+            if layout_name := layout.get("name"):
+                layout_options.append(layout_name)
+            continue
+        layout_uuid = layout_id.get("uuid")
+        layout_name = layout_id.get("name")
+        if layout_name:
+            layout_options.append(layout_name)
+        if layout_uuid:
+            layout_names.setdefault(layout_uuid, layout_name)
+        if layout_name:
+            layout_uuids.setdefault(layout_name, layout_uuid)
+
+    screen_layouts: dict[str, dict[str, Any]] = {}
+    for mapping in layout_map:
+        screen_data = mapping.get("screen", {})
+        screen_uuid = screen_data.get("uuid") or screen_data.get("id")
+        if screen_uuid:
+            screen_layouts.setdefault(screen_uuid, mapping.get("layout", {}))
+
+    return StageLayoutIndex(
+        screens, layout_names, layout_uuids, screen_layouts, layout_options
+    )